@@ -1,18 +1,22 @@
 # app.py
-from flask import Flask, request, jsonify
+from flask import Flask, Request, request, jsonify
 from flask_cors import CORS
 import os
 import logging
-from werkzeug.utils import secure_filename
 import pytesseract
-import pdf2image
-import tempfile
-from pathlib import Path
-from document_validators import DOCUMENT_VALIDATORS
-import cv2
-import numpy as np
+from document_validators import DOCUMENT_VALIDATORS, PATTERNS
+from document_classifier import Candidate, DocumentClassifier
+from normalized_text import NormalizedText
+from ocr_pipeline import OCROptions, PageOCRPool, PageResult, PIPELINE_VERSION
+from ocr_cache import OCRCache
+from preprocessing import DOCUMENT_PIPELINES, PIPELINES
+from pdf_pages import RenderSettings, count_pages, inspect_pages, iter_rendered_pages
+from uploads import UploadedPDF, default_tmp_dir
+from jobs import Job, JobQueue, JobStore
 import re
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -22,79 +26,408 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
-# Configure upload folder and allowed extensions
-UPLOAD_FOLDER = 'uploads'
+# Configure allowed extensions and upload handling: uploads up to
+# UPLOAD_MEMORY_LIMIT bytes stay in memory, larger ones spill to a private
+# temporary file in UPLOAD_TMP_DIR (tmpfs by default)
 ALLOWED_EXTENSIONS = {'pdf'}
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['UPLOAD_MEMORY_LIMIT'] = int(os.environ.get('UPLOAD_MEMORY_LIMIT', 16 * 1024 * 1024))
+app.config['UPLOAD_TMP_DIR'] = os.environ.get('UPLOAD_TMP_DIR') or default_tmp_dir()
 
-# Create uploads folder if it doesn't exist
-Path(UPLOAD_FOLDER).mkdir(parents=True, exist_ok=True)
 
-# Configure Tesseract path
-pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'  # Windows
+class UploadRequest(Request):
+    """Spool file fields in memory up to UPLOAD_MEMORY_LIMIT, then to UPLOAD_TMP_DIR"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        # The parser writes each file field straight into the UploadedPDF handlers verify
+        return UploadedPDF(
+            max_memory_bytes=app.config['UPLOAD_MEMORY_LIMIT'], tmp_dir=app.config['UPLOAD_TMP_DIR']
+        )
+
+
+def open_upload(file) -> UploadedPDF:
+    """The upload behind a file field, copied only if it was not parsed into an UploadedPDF"""
+    if isinstance(file.stream, UploadedPDF):
+        return file.stream
+    return UploadedPDF(
+        file.stream,
+        max_memory_bytes=app.config['UPLOAD_MEMORY_LIMIT'],
+        tmp_dir=app.config['UPLOAD_TMP_DIR']
+    )
+
+
+app.request_class = UploadRequest
+
+# OCR pool configuration: worker processes (1 = serial) and per-page timeout in seconds
+app.config['OCR_WORKERS'] = int(os.environ.get('OCR_WORKERS', os.cpu_count() or 1))
+app.config['OCR_PAGE_TIMEOUT'] = float(os.environ.get('OCR_PAGE_TIMEOUT', 120))
+
+# Second-pass gating: 'gated' runs the grayscale pass only when the first pass
+# falls below the confidence/word thresholds, 'dual' always runs both passes
+app.config['OCR_MODE'] = os.environ.get('OCR_MODE', 'gated')
+app.config['OCR_MIN_CONFIDENCE'] = float(os.environ.get('OCR_MIN_CONFIDENCE', 60))
+app.config['OCR_MIN_WORDS'] = int(os.environ.get('OCR_MIN_WORDS', 10))
+
+# Preprocessing pipeline used when neither the request nor DOCUMENT_PIPELINES picks one
+app.config['OCR_PIPELINE'] = os.environ.get('OCR_PIPELINE', 'default')
+
+# OCR only detected text blocks (skips photos, holograms and background)
+app.config['OCR_TEXT_REGIONS'] = os.environ.get('OCR_TEXT_REGIONS', '0') == '1'
+
+# Route each page to the language models of its detected script (needs osd.traineddata)
+app.config['OCR_SCRIPT_ROUTING'] = os.environ.get('OCR_SCRIPT_ROUTING', '0') == '1'
+
+# Born-digital PDFs: pages whose embedded text layer passes these checks skip OCR
+app.config['TEXT_LAYER_ENABLED'] = os.environ.get('TEXT_LAYER_ENABLED', '1') == '1'
+app.config['TEXT_LAYER_MIN_CHARS'] = int(os.environ.get('TEXT_LAYER_MIN_CHARS', 50))
+app.config['TEXT_LAYER_MIN_QUALITY'] = float(os.environ.get('TEXT_LAYER_MIN_QUALITY', 0.9))
+
+# Page rendering: pages are rendered at the DPI that puts text at
+# TARGET_TEXT_HEIGHT pixels (RENDER_DPI when that cannot be worked out), within
+# MIN/MAX_RENDER_DPI and MAX_PAGE_PIXELS. Pages beyond MAX_PDF_PAGES are skipped.
+app.config['MAX_PDF_PAGES'] = int(os.environ.get('MAX_PDF_PAGES', 50))
+app.config['MAX_PAGE_PIXELS'] = int(os.environ.get('MAX_PAGE_PIXELS', 20_000_000))
+app.config['RENDER_DPI'] = int(os.environ.get('RENDER_DPI', 200))
+app.config['TARGET_TEXT_HEIGHT'] = int(os.environ.get('TARGET_TEXT_HEIGHT', 32))
+app.config['MIN_RENDER_DPI'] = int(os.environ.get('MIN_RENDER_DPI', 72))
+app.config['MAX_RENDER_DPI'] = int(os.environ.get('MAX_RENDER_DPI', 400))
+
+# Early termination: for these document types, pages stop being rendered and OCRed
+# once the validator accepts the text so far at EARLY_STOP_CONFIDENCE or above
+app.config['EARLY_STOP_DOCUMENTS'] = [
+    doc for doc in os.environ.get('EARLY_STOP_DOCUMENTS', 'Aadhar Card,PAN Card,Voter ID').split(',')
+    if doc
+]
+app.config['EARLY_STOP_CONFIDENCE'] = float(os.environ.get('EARLY_STOP_CONFIDENCE', 0.8))
+
+# OCR result cache: in-memory LRU entries plus a size-capped disk store
+app.config['OCR_CACHE_ENTRIES'] = int(os.environ.get('OCR_CACHE_ENTRIES', 256))
+app.config['OCR_CACHE_DIR'] = os.environ.get('OCR_CACHE_DIR', 'ocr_cache')
+app.config['OCR_CACHE_MAX_BYTES'] = int(os.environ.get('OCR_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Asynchronous verification jobs: worker threads, the SQLite job database,
+# the longest a status request may long-poll and how long finished jobs are
+# kept before they are deleted, in seconds (0 keeps them forever)
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+app.config['JOB_DB_PATH'] = os.environ.get('JOB_DB_PATH', 'jobs.sqlite3')
+app.config['JOB_MAX_WAIT'] = float(os.environ.get('JOB_MAX_WAIT', 30))
+app.config['JOB_RETENTION_SECONDS'] = float(os.environ.get('JOB_RETENTION_SECONDS', 7 * 24 * 3600))
+
+# Batch verification: most documents per request, and how many of them are
+# OCRed at once. Their pages all share the one OCR pool, so concurrency is
+# also capped by OCR_WORKERS; with OCR_WORKERS=1 documents run one by one
+app.config['BATCH_MAX_DOCUMENTS'] = int(os.environ.get('BATCH_MAX_DOCUMENTS', 10))
+app.config['BATCH_CONCURRENCY'] = int(os.environ.get('BATCH_CONCURRENCY', 4))
+
+# Automatic classification (documentType=auto, /classify): document types need
+# CLASSIFY_MIN_WEIGHT of keyword evidence to be candidates, at most
+# CLASSIFY_MAX_CANDIDATES are returned and the best CLASSIFY_VALIDATE_TOP are validated
+AUTO_DOCUMENT_TYPE = 'auto'
+app.config['CLASSIFY_MIN_WEIGHT'] = float(os.environ.get('CLASSIFY_MIN_WEIGHT', 5.0))
+app.config['CLASSIFY_MAX_CANDIDATES'] = int(os.environ.get('CLASSIFY_MAX_CANDIDATES', 5))
+app.config['CLASSIFY_VALIDATE_TOP'] = int(os.environ.get('CLASSIFY_VALIDATE_TOP', 2))
+
+# Configure Tesseract path: TESSERACT_CMD, else the Windows installer location
+# on Windows and 'tesseract' on the PATH everywhere else
+if os.name == 'nt':
+    DEFAULT_TESSERACT_CMD = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+else:
+    DEFAULT_TESSERACT_CMD = 'tesseract'
+app.config['TESSERACT_CMD'] = os.environ.get('TESSERACT_CMD', DEFAULT_TESSERACT_CMD)
+pytesseract.pytesseract.tesseract_cmd = app.config['TESSERACT_CMD']
+
+# Shared page OCR pool, started lazily on the first request
+ocr_pool = PageOCRPool(
+    max_workers=app.config['OCR_WORKERS'],
+    page_timeout=app.config['OCR_PAGE_TIMEOUT'] or None
+)
+
+render_settings = RenderSettings(
+    dpi=app.config['RENDER_DPI'],
+    target_text_height=app.config['TARGET_TEXT_HEIGHT'],
+    min_dpi=app.config['MIN_RENDER_DPI'],
+    max_dpi=app.config['MAX_RENDER_DPI'],
+    max_pixels=app.config['MAX_PAGE_PIXELS']
+)
+
+# Server settings that change the extracted text, so cached texts are not reused across them
+settings_variant = render_settings.cache_variant() + (
+    f"max_pages={app.config['MAX_PDF_PAGES']}",
+    f"text_layer_min_chars={app.config['TEXT_LAYER_MIN_CHARS']}",
+    f"text_layer_min_quality={app.config['TEXT_LAYER_MIN_QUALITY']:g}"
+)
+
+ocr_cache = OCRCache(
+    PIPELINE_VERSION,
+    max_entries=app.config['OCR_CACHE_ENTRIES'],
+    disk_dir=app.config['OCR_CACHE_DIR'] or None,
+    disk_max_bytes=app.config['OCR_CACHE_MAX_BYTES']
+)
+
+# Inverted keyword index over every validator's markers
+classifier = DocumentClassifier(DOCUMENT_VALIDATORS, PATTERNS)
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def process_pdf(file) -> str:
-    """Process PDF file and extract text"""
-    try:
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], f"temp_{filename}")
-        file.save(temp_path)
+def get_ocr_options(form, doc_type: str) -> OCROptions:
+    """Build OCR options from app config, allowing per-request ocrMode and pipeline overrides"""
+    mode = form.get('ocrMode') or app.config['OCR_MODE']
+    if mode not in ('gated', 'dual'):
+        raise ValueError(f"Unsupported OCR mode: {mode}")
+    pipeline = form.get('pipeline') or DOCUMENT_PIPELINES.get(doc_type) or app.config['OCR_PIPELINE']
+    if pipeline not in PIPELINES:
+        raise ValueError(f"Unsupported preprocessing pipeline: {pipeline}")
+    return OCROptions(
+        mode=mode,
+        min_confidence=app.config['OCR_MIN_CONFIDENCE'],
+        min_words=app.config['OCR_MIN_WORDS'],
+        text_layer=app.config['TEXT_LAYER_ENABLED'],
+        pipeline=pipeline,
+        text_regions=app.config['OCR_TEXT_REGIONS'],
+        script_routing=app.config['OCR_SCRIPT_ROUTING']
+    )
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace in extracted text"""
+    return re.sub(r'\s+', ' ', text).strip()
+
+def result_confidence(result: Dict[str, Any]) -> float:
+    """Validators report confidence as either confidenceScore or confidence"""
+    return result.get('confidenceScore', result.get('confidence', 0)) or 0
+
+def early_stop_check(doc_type: str) -> Optional[Callable[[str], bool]]:
+    """Return a check that accepts partial text once its validator is confident, if enabled"""
+    if doc_type not in app.config['EARLY_STOP_DOCUMENTS']:
+        return None
+    validator = DOCUMENT_VALIDATORS[doc_type]
+    threshold = app.config['EARLY_STOP_CONFIDENCE']
+    
+    def is_confident(text: str) -> bool:
+        if not text:
+            return False
+        result = validator.validate(text)
+        # Error responses can carry isValid/confidence placeholders, never stop on them
+        if 'error' in result:
+            return False
+        return bool(result.get('isValid')) and result_confidence(result) >= threshold
+    
+    return is_confident
+
+def process_pdf(upload: UploadedPDF, options: OCROptions,
+                stop_check: Optional[Callable[[str], bool]] = None,
+                progress: Optional[Callable[[int, int], None]] = None
+                ) -> Tuple[str, Dict[str, Any]]:
+    """Process PDF upload and extract text along with per-page OCR details.
 
+    When stop_check is given it is called with the cleaned text after every
+    page, and processing stops as soon as it returns True. progress, if given,
+    is called with (pages done, pages to process) after every page.
+    """
+    try:
+        # Use the embedded text layer where it is usable, OCR only the rest
+        # Pages past MAX_PDF_PAGES are never parsed
+        page_infos, page_count = inspect_pages(
+            upload,
+            read_text=options.text_layer,
+            min_chars=app.config['TEXT_LAYER_MIN_CHARS'],
+            min_quality=app.config['TEXT_LAYER_MIN_QUALITY'],
+            max_pages=app.config['MAX_PDF_PAGES']
+        )
+        if page_count > app.config['MAX_PDF_PAGES']:
+            logger.warning(
+                f"PDF has {page_count} pages; processing the first {app.config['MAX_PDF_PAGES']}"
+            )
+        
+        # Render, OCR and release one page at a time, joining results back in order
+        rendered_pages = iter_rendered_pages(
+            upload,
+            [info for info in page_infos if info.text is None],
+            render_settings
+        )
+        ocr_results = ocr_pool.imap_pages(rendered_pages, options)
+        page_results = []
+        extracted_text = ""
+        stopped_early = False
         try:
-            # Convert PDF to images
-            images = pdf2image.convert_from_path(temp_path)
-            extracted_text = ""
-            
-            for img in images:
-                # Convert PIL Image to OpenCV format
-                opencv_img = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-                
-                # Image preprocessing pipeline
-                # 1. Resize if too small
-                height, width = opencv_img.shape[:2]
-                if height < 1000:
-                    scale = 1000/height
-                    opencv_img = cv2.resize(opencv_img, None, fx=scale, fy=scale)
-                
-                # 2. Convert to grayscale
-                gray = cv2.cvtColor(opencv_img, cv2.COLOR_BGR2GRAY)
+            for info in page_infos:
+                if info.text is not None:
+                    page = PageResult(info.text + "\n", 'text-layer')
+                else:
+                    page = next(ocr_results)
+                page_results.append((info.number, page))
+                extracted_text += page.text
+                if progress:
+                    progress(len(page_results), len(page_infos))
                 
-                # 3. Apply adaptive thresholding
-                binary = cv2.adaptiveThreshold(
-                    gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                    cv2.THRESH_BINARY, 11, 2
-                )
-                
-                # 4. Denoise
-                denoised = cv2.fastNlMeansDenoising(binary)
-                
-                # 5. Apply different preprocessing techniques and combine results
-                text1 = pytesseract.image_to_string(denoised, lang='eng+hin')
-                text2 = pytesseract.image_to_string(gray, lang='eng+hin')
-                
-                # Combine texts (this helps catch text that might be missed by one method)
-                extracted_text += text1 + "\n" + text2 + "\n"
-            
-            # Clean up extracted text
-            extracted_text = re.sub(r'\s+', ' ', extracted_text)  # Remove extra whitespace
-            extracted_text = extracted_text.strip()
-            
-            logger.debug(f"Extracted text: {extracted_text}")
-            return extracted_text
-        
+                more_pages = info is not page_infos[-1]
+                if stop_check and more_pages and stop_check(clean_text(extracted_text)):
+                    logger.info(
+                        f"Validator confident after page {info.number}; skipping remaining pages"
+                    )
+                    stopped_early = True
+                    break
         finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # Cancels pages still queued in the OCR pool
+            ocr_results.close()
+        
+        # Clean up extracted text
+        extracted_text = clean_text(extracted_text)  # Remove extra whitespace
+        
+        logger.debug(f"Extracted text: {extracted_text}")
+        return extracted_text, {
+            "pageCount": page_count,
+            "pagesProcessed": len(page_results),
+            "stoppedEarly": stopped_early,
+            "pages": [
+                {"page": number, **page.to_dict()}
+                for number, page in page_results
+            ]
+        }
     
     except Exception as e:
         logger.error(f"Error processing PDF: {str(e)}", exc_info=True)
         raise
     
+def check_upload(file, doc_type: Optional[str]) -> Optional[Tuple[Any, int]]:
+    """Return an error response for a missing or unsupported upload, None if it is fine"""
+    logger.info(f"Processing document type: {doc_type}")
+    
+    if not doc_type:
+        logger.error("Document type not specified")
+        return jsonify({"error": "Document type not specified"}), 400
+    
+    if file.filename == '':
+        logger.error("No selected file")
+        return jsonify({"error": "No selected file"}), 400
+    
+    if not allowed_file(file.filename):
+        logger.error(f"Invalid file type: {file.filename}")
+        return jsonify({"error": "Only PDF files are allowed"}), 400
+    
+    if doc_type not in DOCUMENT_VALIDATORS and doc_type != AUTO_DOCUMENT_TYPE:
+        logger.error(f"Unsupported document type: {doc_type}")
+        return jsonify({
+            "error": f"Unsupported document type: {doc_type}",
+            "isValid": False,
+            "confidence": 0,
+            "details": {"errors": ["Unsupported document type"]}
+        }), 400
+    
+    return None
+
+def extract_upload_text(upload: UploadedPDF, filename: str, doc_type: str, options: OCROptions,
+                        progress: Optional[Callable[[int, int], None]] = None
+                        ) -> Tuple[str, Dict[str, Any]]:
+    """OCR one uploaded document, or fetch its text from the cache"""
+    # Early-stopped text depends on the document type, so it is cached per type
+    stop_check = early_stop_check(doc_type)
+    cache_variant = (options.cache_variant() + settings_variant
+                     + ((f"early_stop={doc_type}",) if stop_check else ()))
+    
+    # Repeat uploads of the same file are served from the OCR cache
+    cache_key = ocr_cache.key(upload.sha256, *cache_variant)
+    extracted_text = ocr_cache.get(cache_key)
+    
+    if extracted_text is None:
+        # Process the PDF and extract text
+        logger.info(f"Extracting text from file: {filename}")
+        extracted_text, details = process_pdf(upload, options, stop_check, progress)
+        ocr_cache.put(cache_key, extracted_text)
+        ocr_info = {"mode": options.mode, "pipeline": options.pipeline, "cached": False, **details}
+    else:
+        logger.info(f"OCR cache hit for file: {filename}")
+        ocr_info = {"mode": options.mode, "pipeline": options.pipeline, "cached": True}
+        if progress:
+            # Nothing left to OCR, so report every page the document would have had
+            # processed as done
+            page_count = min(count_pages(upload), app.config['MAX_PDF_PAGES'])
+            progress(page_count, page_count)
+    return extracted_text, ocr_info
+
+def classify_text(text: NormalizedText) -> List[Candidate]:
+    """Document types the text has enough keyword evidence for, best first"""
+    candidates = [
+        candidate for candidate in classifier.rank(text.upper)
+        if candidate.weight >= app.config['CLASSIFY_MIN_WEIGHT']
+    ]
+    return candidates[:app.config['CLASSIFY_MAX_CANDIDATES']]
+
+def validate_auto(text: NormalizedText) -> Dict[str, Any]:
+    """Validate text as whichever of its best-ranked document types fits it best"""
+    candidates = classify_text(text)
+    validated = candidates[:app.config['CLASSIFY_VALIDATE_TOP']]
+    classification = {
+        "candidates": [candidate.to_dict() for candidate in candidates],
+        "validated": [candidate.document_type for candidate in validated]
+    }
+    logger.info(f"Classified as {classification['validated'] or 'unknown'}")
+    
+    if not validated:
+        return {
+            "isValid": False,
+            "confidence": 0,
+            "documentType": None,
+            "classification": classification,
+            "details": {"errors": ["Could not determine the document type"]}
+        }
+    
+    results = [
+        DOCUMENT_VALIDATORS[candidate.document_type].validate(text) for candidate in validated
+    ]
+    # Prefer a valid result, then the more confident one, then the better-ranked type
+    best = max(range(len(results)), key=lambda i: (
+        bool(results[i].get('isValid')) and 'error' not in results[i],
+        result_confidence(results[i]),
+        -i
+    ))
+    result = results[best]
+    result['classification'] = classification
+    return result
+
+def verify_upload(upload: UploadedPDF, filename: str, doc_type: str, options: OCROptions,
+                  progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """OCR (or fetch from cache) and validate one uploaded document"""
+    extracted_text, ocr_info = extract_upload_text(upload, filename, doc_type, options, progress)
+    
+    # Validate using appropriate validator, or the best candidates for documentType=auto
+    logger.info("Validating document...")
+    normalized = NormalizedText.of(extracted_text)
+    if doc_type == AUTO_DOCUMENT_TYPE:
+        result = validate_auto(normalized)
+    else:
+        result = DOCUMENT_VALIDATORS[doc_type].validate(normalized)
+    result['ocr'] = ocr_info
+    
+    logger.info(f"Validation result: {result['isValid']}")
+    return result
+
+def run_job(job: Job, progress: Callable[[int, int], None]) -> Dict[str, Any]:
+    """Job queue handler: verify a stored upload the same way /verify does"""
+    options = get_ocr_options(job.form, job.document_type)
+    with UploadedPDF.from_bytes(
+        job.pdf,
+        max_memory_bytes=app.config['UPLOAD_MEMORY_LIMIT'],
+        tmp_dir=app.config['UPLOAD_TMP_DIR']
+    ) as upload:
+        return verify_upload(upload, job.filename, job.document_type, options, progress)
+
+job_queue = JobQueue(
+    JobStore(app.config['JOB_DB_PATH']),
+    run_job,
+    workers=app.config['JOB_WORKERS'],
+    retention=app.config['JOB_RETENTION_SECONDS']
+)
+
+def warm_up() -> None:
+    """Start this process's OCR pool and job workers before it takes requests"""
+    try:
+        ocr_pool.warm_up(get_ocr_options({}, ''))
+    except Exception as e:
+        # A broken Tesseract install shows up on the first request instead
+        logger.warning(f"OCR warm-up failed: {str(e)}")
+    job_queue.start()
+
 @app.route('/verify', methods=['POST'])
 def verify_document():
     try:
@@ -105,39 +438,21 @@ def verify_document():
         file = request.files['file']
         doc_type = request.form.get('documentType')
         
-        logger.info(f"Processing document type: {doc_type}")
-        
-        if not doc_type:
-            logger.error("Document type not specified")
-            return jsonify({"error": "Document type not specified"}), 400
+        error_response = check_upload(file, doc_type)
+        if error_response:
+            return error_response
         
-        if file.filename == '':
-            logger.error("No selected file")
-            return jsonify({"error": "No selected file"}), 400
-        
-        if not allowed_file(file.filename):
-            logger.error(f"Invalid file type: {file.filename}")
-            return jsonify({"error": "Only PDF files are allowed"}), 400
-        
-        if doc_type not in DOCUMENT_VALIDATORS:
-            logger.error(f"Unsupported document type: {doc_type}")
-            return jsonify({
-                "error": f"Unsupported document type: {doc_type}",
-                "isValid": False,
-                "confidence": 0,
-                "details": {"errors": ["Unsupported document type"]}
-            }), 400
-        
-        # Process the PDF and extract text
-        logger.info(f"Extracting text from file: {file.filename}")
-        extracted_text = process_pdf(file)
+        try:
+            options = get_ocr_options(request.form, doc_type)
+        except ValueError as e:
+            logger.error(str(e))
+            return jsonify({"error": str(e)}), 400
         
-        # Validate using appropriate validator
-        logger.info("Validating document...")
-        validator = DOCUMENT_VALIDATORS[doc_type]
-        result = validator.validate(extracted_text)
+        # The upload as parsed, already hashed; leaving the block removes any
+        # temporary file made for it
+        with open_upload(file) as upload:
+            result = verify_upload(upload, file.filename, doc_type, options)
         
-        logger.info(f"Validation result: {result['isValid']}")
         return jsonify(result)
                 
     except Exception as e:
@@ -148,6 +463,183 @@ def verify_document():
             "confidence": 0,
             "details": {"errors": [str(e)]}
         }), 500
+
+@app.route('/classify', methods=['POST'])
+def classify_document():
+    """Rank the document types an uploaded PDF could be, without validating it"""
+    try:
+        if 'file' not in request.files:
+            logger.error("No file provided in request")
+            return jsonify({"error": "No file provided"}), 400
+        
+        file = request.files['file']
+        error_response = check_upload(file, AUTO_DOCUMENT_TYPE)
+        if error_response:
+            return error_response
+        
+        try:
+            options = get_ocr_options(request.form, AUTO_DOCUMENT_TYPE)
+        except ValueError as e:
+            logger.error(str(e))
+            return jsonify({"error": str(e)}), 400
+        
+        with open_upload(file) as upload:
+            extracted_text, ocr_info = extract_upload_text(
+                upload, file.filename, AUTO_DOCUMENT_TYPE, options
+            )
+        
+        normalized = NormalizedText.of(extracted_text)
+        candidates = classify_text(normalized)
+        return jsonify({
+            "documentType": candidates[0].document_type if candidates else None,
+            "candidates": [candidate.to_dict() for candidate in candidates],
+            "identifiers": normalized.identifiers.to_list(),
+            "ocr": ocr_info
+        })
+    
+    except Exception as e:
+        logger.error(f"Error classifying document: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/verify/batch', methods=['POST'])
+def verify_batch():
+    """Verify an applicant's whole document set in one request.
+
+    Takes repeated 'files' and 'documentTypes' fields, paired by position.
+    With OCR_WORKERS > 1, up to BATCH_CONCURRENCY documents (never more than
+    the OCR pool's workers) are processed at once so their pages keep the
+    shared pool busy; with serial OCR they run one after another. Results
+    come back in upload order, each with its own error.
+    """
+    try:
+        files = request.files.getlist('files')
+        doc_types = request.form.getlist('documentTypes')
         
+        if not files:
+            logger.error("No files provided in batch request")
+            return jsonify({"error": "No files provided"}), 400
+        
+        if len(doc_types) != len(files):
+            logger.error(f"Batch has {len(files)} files but {len(doc_types)} document types")
+            return jsonify({"error": "Each file needs exactly one documentType"}), 400
+        
+        if len(files) > app.config['BATCH_MAX_DOCUMENTS']:
+            logger.error(f"Batch of {len(files)} documents exceeds the limit")
+            limit = app.config['BATCH_MAX_DOCUMENTS']
+            return jsonify({"error": f"At most {limit} documents per batch"}), 400
+        
+        options = []
+        for file, doc_type in zip(files, doc_types):
+            error_response = check_upload(file, doc_type)
+            if error_response:
+                return error_response
+            try:
+                options.append(get_ocr_options(request.form, doc_type))
+            except ValueError as e:
+                logger.error(str(e))
+                return jsonify({"error": str(e)}), 400
+        
+        def verify_one(upload: UploadedPDF, filename: str, doc_type: str,
+                       doc_options: OCROptions) -> Dict[str, Any]:
+            try:
+                result = verify_upload(upload, filename, doc_type, doc_options)
+            except Exception as e:
+                logger.error(f"Error processing {filename}: {str(e)}", exc_info=True)
+                result = {
+                    "error": str(e),
+                    "isValid": False,
+                    "confidence": 0,
+                    "details": {"errors": [str(e)]}
+                }
+            return {"filename": filename, "documentType": doc_type, **result}
+        
+        with ExitStack() as stack:
+            uploads = [stack.enter_context(open_upload(file)) for file in files]
+            logger.info(f"Verifying batch of {len(uploads)} documents: {doc_types}")
+            # More documents at once than OCR workers would only queue pages or share a core
+            concurrency = min(app.config['BATCH_CONCURRENCY'], ocr_pool.max_workers, len(uploads))
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                results = list(executor.map(
+                    verify_one, uploads, [file.filename for file in files], doc_types, options
+                ))
+        
+        return jsonify({
+            "documents": results,
+            "documentCount": len(results),
+            "validCount": sum(1 for result in results if result.get('isValid'))
+        })
+        
+    except Exception as e:
+        logger.error(f"Error processing batch request: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/verify/jobs', methods=['POST'])
+def create_verification_job():
+    """Queue a document for verification and return its job id at once"""
+    try:
+        if 'file' not in request.files:
+            logger.error("No file provided in request")
+            return jsonify({"error": "No file provided"}), 400
+        
+        file = request.files['file']
+        doc_type = request.form.get('documentType')
+        
+        error_response = check_upload(file, doc_type)
+        if error_response:
+            return error_response
+        
+        # Reject bad OCR options now rather than failing the job later
+        try:
+            get_ocr_options(request.form, doc_type)
+        except ValueError as e:
+            logger.error(str(e))
+            return jsonify({"error": str(e)}), 400
+        
+        job = job_queue.submit(doc_type, file.filename, request.form.to_dict(), file.read())
+        response = jsonify(job.to_dict())
+        response.headers['Location'] = f"/verify/jobs/{job.id}"
+        return response, 202
+        
+    except Exception as e:
+        logger.error(f"Error queueing verification job: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/verify/jobs/<job_id>', methods=['GET'])
+def get_verification_job(job_id: str):
+    """Job status, page progress and, once done, the validation result.
+
+    ?wait=<seconds> long-polls until the job finishes, up to JOB_MAX_WAIT.
+    """
+    try:
+        wait = min(float(request.args.get('wait', 0)), app.config['JOB_MAX_WAIT'])
+    except ValueError:
+        return jsonify({"error": "wait must be a number of seconds"}), 400
+    
+    job = job_queue.wait(job_id, wait) if wait > 0 else job_queue.store.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job: {job_id}"}), 404
+    return jsonify(job.to_dict())
+        
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    return jsonify(ocr_cache.stats())
+
+@app.route('/validators/patterns', methods=['GET'])
+def validator_patterns():
+    """Every compiled validator pattern with its flags, optionally for one document type"""
+    doc_type = request.args.get('documentType')
+    if doc_type is not None and doc_type not in PATTERNS.owners():
+        return jsonify({"error": f"No patterns for document type '{doc_type}'"}), 404
+    return jsonify({
+        "frozen": PATTERNS.frozen,
+        "patternCount": PATTERNS.count(doc_type),
+        "patterns": PATTERNS.listing(doc_type)
+    })
+
 if __name__ == '__main__':
+    # Development server; see wsgi.py and gunicorn.conf.py for production.
+    # The reloader runs the app in a child process; only that one starts
+    # workers, so the watching parent does not claim jobs as well
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        warm_up()
     app.run(debug=True)
\ No newline at end of file
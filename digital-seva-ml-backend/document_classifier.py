@@ -0,0 +1,95 @@
+# document_classifier.py
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple
+
+from pattern_registry import PatternRegistry
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Pattern syntax removed before literal words are read out of a pattern
+CHAR_CLASS = re.compile(r'\[(?:\\.|[^\]])*\]')
+ESCAPE = re.compile(r'\\.')
+# Words long enough to say something about the document type
+KEYWORD = re.compile(r'[A-Z]{3,}|[ऀ-ॿ]{2,}')
+# Words in extracted text
+TOKEN = re.compile(r'[A-Z]+|[ऀ-ॿ]+')
+
+
+@dataclass
+class Candidate:
+    """A document type the text could be, with the keywords that point to it"""
+    document_type: str
+    # Summed IDF weight of the type's keywords found in the text
+    weight: float
+    # Share of the weight of all types, so scores add up to 1
+    score: float = 0.0
+    keywords: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "documentType": self.document_type,
+            "score": round(self.score, 4),
+            "weight": round(self.weight, 3),
+            "keywords": self.keywords
+        }
+
+
+class DocumentClassifier:
+    """Ranks document types for a text from the validators' own markers.
+
+    Every literal word in a validator's registered patterns (plus any plain
+    keyword lists it keeps in key_indicators) becomes a keyword of its
+    document type. Keywords go into one inverted index, weighted by IDF, so
+    words most types share (NAME, DATE) count for little and words only one
+    type uses (EPIC, PASSBOOK) count for most. Ranking a text is one pass
+    over its words and a lookup per distinct word.
+    """
+
+    def __init__(self, validators: Dict[str, Any], registry: PatternRegistry):
+        listing = registry.listing()
+        keywords: Dict[str, Set[str]] = {}
+        for doc_type, validator in validators.items():
+            words = set()
+            for entry in listing.get(doc_type, []):
+                source = ESCAPE.sub(' ', CHAR_CLASS.sub(' ', entry['pattern']))
+                if 'IGNORECASE' in entry['flags']:
+                    source = source.upper()
+                words.update(KEYWORD.findall(source))
+            for indicators in getattr(validator, 'key_indicators', {}).values():
+                for indicator in indicators:
+                    words.update(KEYWORD.findall(indicator))
+            keywords[doc_type] = words
+
+        document_frequency: Dict[str, int] = {}
+        for words in keywords.values():
+            for word in words:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+
+        # Keyword -> [(document type, weight)]; words every type uses get weight 0 and are left out
+        self.index: Dict[str, List[Tuple[str, float]]] = {}
+        type_count = len(keywords)
+        for doc_type, words in keywords.items():
+            for word in words:
+                weight = math.log(type_count / document_frequency[word])
+                if weight > 0:
+                    self.index.setdefault(word, []).append((doc_type, weight))
+        logger.debug(f"Classifier index: {len(self.index)} keywords over {type_count} document types")
+
+    def rank(self, text: str) -> List[Candidate]:
+        """Document types with at least one keyword in the text, best first"""
+        candidates: Dict[str, Candidate] = {}
+        for word in set(TOKEN.findall(text.upper())):
+            for doc_type, weight in self.index.get(word, ()):
+                candidate = candidates.setdefault(doc_type, Candidate(doc_type, 0.0))
+                candidate.weight += weight
+                candidate.keywords.append(word)
+
+        total = sum(candidate.weight for candidate in candidates.values())
+        for candidate in candidates.values():
+            candidate.score = candidate.weight / total
+            candidate.keywords.sort()
+        return sorted(candidates.values(), key=lambda candidate: (-candidate.weight, candidate.document_type))
@@ -0,0 +1,62 @@
+# fuzzy_index.py
+import logging
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class FuzzyIndex:
+    """Matches OCR'd words against a fixed keyword list, tolerating OCR noise.
+
+    A word matches a keyword when difflib.SequenceMatcher(None, word,
+    keyword).ratio() reaches the threshold, exactly as before; the index only
+    avoids building matchers that cannot get there. Keywords are bucketed by
+    length, and a pair is skipped when its length ratio or its shared
+    character counts (the same bound as SequenceMatcher.quick_ratio) already
+    fall short. Results are cached per word, since OCR text repeats words a
+    lot and the index is shared by every request.
+    """
+
+    def __init__(self, keywords: Iterable[str], threshold: float, cache_size: int = 4096):
+        self.keywords = list(keywords)
+        self.threshold = threshold
+        self._by_length: Dict[int, List[int]] = {}
+        for i, keyword in enumerate(self.keywords):
+            self._by_length.setdefault(len(keyword), []).append(i)
+        self._counts = [Counter(keyword) for keyword in self.keywords]
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, word: str) -> Optional[str]:
+        """First keyword, in list order, the word matches"""
+        word_length = len(word)
+        word_counts = None
+        candidates = []
+        for length, indexes in self._by_length.items():
+            # ratio() is at most 2 * min(len) / (len + len)
+            total = word_length + length
+            if total and 2.0 * min(word_length, length) / total >= self.threshold:
+                candidates.extend(indexes)
+
+        for i in sorted(candidates):
+            keyword = self.keywords[i]
+            total = word_length + len(keyword)
+            if word_counts is None:
+                word_counts = Counter(word)
+            shared = sum(min(count, word_counts[char]) for char, count in self._counts[i].items())
+            if 2.0 * shared / total < self.threshold:
+                continue
+            if SequenceMatcher(None, word, keyword).ratio() >= self.threshold:
+                return keyword
+        return None
+
+    def find(self, text: str) -> List[str]:
+        """Words of the text that match some keyword, each listed once"""
+        return [word for word in dict.fromkeys(text.split()) if self.match(word)]
+
+    def contains(self, text: str) -> bool:
+        """Whether any word of the text matches some keyword"""
+        return any(self.match(word) for word in dict.fromkeys(text.split()))
@@ -0,0 +1,26 @@
+# gunicorn.conf.py
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# One worker process per core. Each worker OCRs its own pages in-process, so
+# the per-request OCR pool is off unless OCR_WORKERS is set explicitly;
+# otherwise workers x pool processes would oversubscribe the cores.
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+os.environ.setdefault('OCR_WORKERS', '1')
+
+# Multi-page OCR can take minutes; the job API is there for anything longer
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+
+# Import the app, its validators and their patterns once in the master, so
+# forked workers share them copy-on-write instead of each loading its own
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Pools, engines and threads do not survive a fork; build them and run a
+    # warm-up OCR before this worker takes its first request
+    from wsgi import warm_up
+    warm_up()
@@ -0,0 +1,360 @@
+# identifier_extractor.py
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Runs of letters and digits; a printed identifier is one or more of these
+TOKEN = re.compile(r'[A-Za-z0-9]+')
+# Stretches of text an identifier can be in. Every identifier has a digit in
+# it, and when printed in parts, every part after the first is all digits or
+# short (MH 12 2011 0012345, ABC P E 1234 F, AB/12/345/678901). So a stretch
+# is a run with a digit and the digit or short runs right after it, joined by
+# single separators. Each part ends where its character class does, so giving
+# characters back never finds another match and the scan stays linear.
+STRETCH = re.compile(
+    r'(?<![A-Za-z0-9])[A-Za-z]*[0-9][A-Za-z0-9]*'
+    r'(?:[ \t\n/-](?:[0-9]+|[A-Za-z0-9]{1,5})(?![A-Za-z0-9]))*'
+)
+# The letter runs an identifier can start with right before a stretch (MH 12 ..., ABC P E 1234 F)
+LETTER_PREFIX = re.compile(r'(?<![A-Za-z0-9])(?:[A-Za-z]{1,5}[ \t\n/-]){1,4}\Z')
+# What OCR leaves between the parts of one identifier (2345 6789 0123, MH-12-2011-0012345, MH/1234567)
+SPACES = frozenset(' \t\n')
+DASH = frozenset('-')
+SLASH = frozenset('/')
+SPACES_OR_DASH = SPACES | DASH
+SEPARATORS = SPACES_OR_DASH | SLASH
+# Longest identifier, the most parts one can be printed in, and the most letters before its first digit
+MAX_LENGTH = 18
+MAX_PARTS = 5
+MAX_LETTER_PREFIX = 5
+# How far before a candidate its label can start
+LABEL_WINDOW = 40
+
+AADHAAR = 'aadhaar'
+PAN = 'pan'
+EPIC = 'epic'
+IFSC = 'ifsc'
+DRIVING_LICENSE = 'driving_license'
+ACCOUNT = 'account'
+PIN = 'pin'
+
+# Labels that introduce an identifier, compared against the text before it with spacing collapsed
+LABELS = {
+    EPIC: ('EPIC NO', 'EPIC NUMBER'),
+    IFSC: ('IFSC', 'IFSC CODE', 'INDIAN FINANCIAL SYSTEM CODE'),
+    ACCOUNT: ('A/C NO', 'AC NO', 'A/C NUMBER', 'ACCOUNT NO', 'ACCOUNT NUMBER', 'खाता संख्या'),
+    PIN: ('PIN', 'PIN CODE', 'PINCODE')
+}
+# Kinds only taken in several parts after their label; unlabelled digit groups are more likely phone numbers
+GROUPED_ONLY_WHEN_LABELLED = {ACCOUNT}
+# Kinds also looked for inside longer runs, where OCR glued them to the next word (ABCPE1234FNAME)
+EMBEDDED = {
+    PAN: re.compile(r'[A-Z]{3}[PCHABLJGF][A-Z][0-9]{4}[A-Z]'),
+    EPIC: re.compile(r'[A-Z]{3}[0-9]{7}')
+}
+
+# Fourth letter of a PAN: the kind of holder (Person, Company, HUF, ...)
+PAN_HOLDER_TYPES = 'PCHABLJGF'
+
+# Verhoeff checksum tables, as used by UIDAI for the last Aadhaar digit
+VERHOEFF_MULTIPLY = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 2, 3, 4, 0, 6, 7, 8, 9, 5),
+    (2, 3, 4, 0, 1, 7, 8, 9, 5, 6),
+    (3, 4, 0, 1, 2, 8, 9, 5, 6, 7),
+    (4, 0, 1, 2, 3, 9, 5, 6, 7, 8),
+    (5, 9, 8, 7, 6, 0, 4, 3, 2, 1),
+    (6, 5, 9, 8, 7, 1, 0, 4, 3, 2),
+    (7, 6, 5, 9, 8, 2, 1, 0, 4, 3),
+    (8, 7, 6, 5, 9, 3, 2, 1, 0, 4),
+    (9, 8, 7, 6, 5, 4, 3, 2, 1, 0)
+)
+VERHOEFF_PERMUTE = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 5, 7, 6, 2, 8, 3, 0, 9, 4),
+    (5, 8, 0, 3, 7, 9, 6, 1, 4, 2),
+    (8, 9, 1, 6, 0, 4, 3, 5, 2, 7),
+    (9, 4, 5, 3, 1, 2, 6, 8, 7, 0),
+    (4, 2, 8, 6, 5, 7, 3, 9, 0, 1),
+    (2, 7, 9, 3, 8, 0, 6, 4, 1, 5),
+    (7, 0, 4, 6, 9, 1, 3, 2, 5, 8)
+)
+
+
+def verhoeff_valid(number: str) -> bool:
+    """Whether a string of digits ends in its correct Verhoeff check digit"""
+    check = 0
+    for position, digit in enumerate(reversed(number)):
+        check = VERHOEFF_MULTIPLY[check][VERHOEFF_PERMUTE[position % 8][int(digit)]]
+    return check == 0
+
+
+@dataclass(frozen=True)
+class Identifier:
+    """A candidate ID number found in a text"""
+    kind: str
+    # Without separators, e.g. 234567890124
+    value: str
+    # As printed, e.g. 2345 6789 0124
+    text: str
+    start: int
+    end: int
+    # Follows the official format exactly, rather than only looking like an OCR'd one
+    exact: bool = True
+    # Comes right after its label (EPIC NO:, IFSC CODE:, ...)
+    labelled: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "value": self.value,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "exact": self.exact,
+            "labelled": self.labelled
+        }
+
+
+class IdentifierTable:
+    """Every candidate identifier of a text, by kind, in text order"""
+
+    def __init__(self, identifiers: List[Identifier]):
+        self.identifiers = sorted(identifiers, key=lambda identifier: (identifier.start, identifier.kind))
+        self._by_kind: Dict[str, List[Identifier]] = {}
+        for identifier in self.identifiers:
+            self._by_kind.setdefault(identifier.kind, []).append(identifier)
+
+    def of(self, kind: str) -> List[Identifier]:
+        return self._by_kind.get(kind, [])
+
+    def best(self, kind: str) -> Optional[Identifier]:
+        """Labelled candidates first, then exact ones, then the earliest"""
+        candidates = self.of(kind)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda identifier: (not identifier.labelled, not identifier.exact, identifier.start))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [identifier.to_dict() for identifier in self.identifiers]
+
+
+# A check gets a candidate's value, the parts it is printed in and the
+# separators between them, and says whether it is an exact (True) or a
+# plausible (False) identifier of its kind, or None when no identifier of
+# that kind can look like this. Checks only see values of their kind's lengths,
+# all digits for the digit-only kinds and with a letter for the others.
+Check = Callable[[str, List[str], str], Optional[bool]]
+
+
+def _split_points(parts: List[str]) -> set:
+    points, length = set(), 0
+    for part in parts[:-1]:
+        length += len(part)
+        points.add(length)
+    return points
+
+
+def _check_aadhaar(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    if not value.isdigit() or not set(gaps) <= SPACES_OR_DASH or not _split_points(parts) <= {4, 8}:
+        return None
+    # Aadhaar numbers never start with 0 or 1, and end in a Verhoeff check digit
+    if value[0] in '01' or not verhoeff_valid(value):
+        return None
+    return True
+
+
+def _check_pan(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    if not set(gaps) <= SPACES or not _split_points(parts) <= {3, 4, 5, 9}:
+        return None
+    if (value[:5].isalpha() and value[5:9].isdigit() and value[9].isalpha()
+            and value[3] in PAN_HOLDER_TYPES):
+        return True
+    return None
+
+
+def _check_epic(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    if len(parts) == 1:
+        if len(value) != 10:
+            return None
+        if value[:3].isalpha() and value[3:].isdigit():
+            return True
+        # OCR'd EPICs have letters read as digits and back, but always some of each
+        if not value.isalpha() and not value.isdigit():
+            return False
+        return None
+    # Older EPICs: AB/12/345/678901 or AB/1234567
+    if not set(gaps) <= SLASH or not parts[0].isalpha() or len(parts[0]) not in (2, 3):
+        return None
+    numbers = parts[1:]
+    if not all(part.isdigit() for part in numbers):
+        return None
+    lengths = tuple(len(part) for part in numbers)
+    if lengths == (2, 3, 6) or (len(lengths) == 1 and 6 <= lengths[0] <= 8):
+        return True
+    return None
+
+
+def _check_ifsc(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    # Bank code, a reserved 0, then the branch code, which has digits in it
+    if len(parts) == 1 and value[:4].isalpha() and value[4] == '0' and not value[5:].isalpha():
+        return True
+    return None
+
+
+def _check_driving_license(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    # State code, then the RTO code and serial number, all digits (MH-12/2011/0012345 on some states' cards)
+    if not set(gaps) <= SEPARATORS or not value[:2].isalpha() or not value[2:4].isdigit():
+        return None
+    if len(value) == 15 and value[2:].isdigit() and _split_points(parts) <= {2, 4, 8}:
+        # SS RR YYYY NNNNNNN, with the year of issue
+        return value[4:6] in ('19', '20')
+    if len(value) == 12 and value[2:].isdigit() and _split_points(parts) <= {2, 4}:
+        return True
+    if len(parts) == 1 and sum(c.isdigit() for c in value) >= 7:
+        return False
+    return None
+
+
+def _check_account(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    return True if value.isdigit() else None
+
+
+def _check_pin(value: str, parts: List[str], gaps: str) -> Optional[bool]:
+    if len(parts) == 1 and value.isdigit() and value[0] != '0':
+        return True
+    return None
+
+
+# kind -> (structural check, shortest and longest value without separators, digits only)
+CHECKS: Dict[str, Tuple[Check, int, int, bool]] = {
+    AADHAAR: (_check_aadhaar, 12, 12, True),
+    PAN: (_check_pan, 10, 10, False),
+    EPIC: (_check_epic, 8, 14, False),
+    IFSC: (_check_ifsc, 11, 11, False),
+    DRIVING_LICENSE: (_check_driving_license, 9, 16, False),
+    ACCOUNT: (_check_account, 9, 18, True),
+    PIN: (_check_pin, 6, 6, True)
+}
+# (value length, digits only) -> [(kind, check)], in CHECKS order
+CHECKS_BY_SHAPE: Dict[Tuple[int, bool], List[Tuple[str, Check]]] = {
+    (length, digits): [
+        (kind, check) for kind, (check, shortest, longest, only_digits) in CHECKS.items()
+        if shortest <= length <= longest and only_digits == digits
+    ]
+    for length in range(MAX_LENGTH + 1) for digits in (True, False)
+}
+
+
+def _text_before(text: str, start: int) -> str:
+    """The text just before a candidate, as a label would appear in it"""
+    return ' '.join(text[max(0, start - LABEL_WINDOW):start].upper().split()).rstrip(' :.-#')
+
+
+def _has_label(before: str, kind: str) -> bool:
+    return any(
+        before.endswith(label) and (len(before) == len(label) or not before[-len(label) - 1].isalnum())
+        for label in LABELS.get(kind, ())
+    )
+
+
+def extract_identifiers(text: str) -> IdentifierTable:
+    """Find every candidate Aadhaar, PAN, EPIC, IFSC, DL, account and PIN number in one pass.
+
+    One regex scan finds the stretches of text identifiers can be in (see
+    STRETCH), which skips prose. In each stretch, every run starts windows of
+    up to MAX_PARTS runs, offered longest first to a cheap structural check
+    per kind: lengths, letter and digit positions, Aadhaar's Verhoeff digit.
+    Several kinds can share a start (a PAN also looks like an OCR'd EPIC), but
+    no candidate starts inside an earlier one, so the digits of an Aadhaar or
+    EPIC are not offered again as a PIN.
+    """
+    identifiers = []
+    # End of the last candidate found
+    covered_until = 0
+
+    for stretch in STRETCH.finditer(text):
+        offset = stretch.start()
+        if offset and text[offset - 1] in SEPARATORS:
+            # At most MAX_LETTER_PREFIX letters and a separator after each
+            prefix = LETTER_PREFIX.search(text, max(0, offset - 2 * MAX_LETTER_PREFIX), offset)
+            if prefix:
+                offset = prefix.start()
+        if offset == stretch.start() and stretch.group().isalnum():
+            # A single run, by far the most common stretch
+            tokens = [(stretch.start(), stretch.end(), stretch.group())]
+        else:
+            tokens = [(token.start(), token.end(), token.group())
+                      for token in TOKEN.finditer(text, offset, stretch.end())]
+
+        for first, (span_start, _, first_part) in enumerate(tokens):
+            if span_start < covered_until:
+                continue
+            # Windows starting here that some kind could accept: value, checks, parts, separators, end
+            windows = []
+            value, parts, gaps = '', [], ''
+            for last in range(first, min(first + MAX_PARTS, len(tokens))):
+                start, end, part = tokens[last]
+                if last > first:
+                    gaps += text[start - 1]
+                value += part
+                parts.append(part)
+                if len(value) > MAX_LENGTH:
+                    break
+                if value.isalpha():
+                    if len(value) > MAX_LETTER_PREFIX:
+                        break
+                    continue
+                checks = CHECKS_BY_SHAPE[len(value), value.isdigit()]
+                if checks:
+                    windows.append((value, checks, parts[:], gaps, end))
+
+            # Each kind takes the widest window it accepts
+            before = None
+            taken = set()
+            for value, checks, parts, gaps, span_end in reversed(windows):
+                for kind, check in checks:
+                    if kind in taken:
+                        continue
+                    exact = check(value, parts, gaps)
+                    if exact is None:
+                        continue
+                    if before is None:
+                        before = _text_before(text, span_start)
+                    labelled = _has_label(before, kind)
+                    if kind in GROUPED_ONLY_WHEN_LABELLED and len(parts) > 1 and not labelled:
+                        continue
+                    identifiers.append(Identifier(
+                        kind=kind,
+                        value=value.upper(),
+                        text=text[span_start:span_end],
+                        start=span_start,
+                        end=span_end,
+                        exact=exact,
+                        labelled=labelled
+                    ))
+                    taken.add(kind)
+                    covered_until = max(covered_until, span_end)
+
+            # Only look inside a run that is not an identifier itself
+            if taken or first_part.isalpha() or first_part.isdigit():
+                continue
+            for kind, pattern in EMBEDDED.items():
+                match = pattern.search(first_part)
+                if match:
+                    identifiers.append(Identifier(
+                        kind=kind,
+                        value=match.group(),
+                        text=match.group(),
+                        start=span_start + match.start(),
+                        end=span_start + match.end(),
+                        exact=False
+                    ))
+                    covered_until = max(covered_until, span_start + len(first_part))
+
+    logger.debug(f"Found {len(identifiers)} identifier candidates")
+    return IdentifierTable(identifiers)
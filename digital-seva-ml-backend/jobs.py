@@ -0,0 +1,299 @@
+# jobs.py
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+FINISHED = (DONE, FAILED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    document_type TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    form TEXT NOT NULL,
+    pdf BLOB,
+    progress TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    owner_pid INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class Job:
+    """One verification job as stored in the job database"""
+    id: str
+    status: str
+    document_type: str
+    filename: str
+    form: Dict[str, str] = field(default_factory=dict)
+    pdf: Optional[bytes] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    owner_pid: Optional[int] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.id,
+            "status": self.status,
+            "documentType": self.document_type,
+            "filename": self.filename,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at
+        }
+
+
+class JobStore:
+    """SQLite-backed job state, shared by every thread and process using the same file.
+
+    The uploaded PDF is kept with the job until it finishes, so queued and
+    interrupted jobs can be run again after a restart.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call keeps the store safe to use from any thread
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:  # Commits, or rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def create(self, document_type: str, filename: str, form: Dict[str, str], pdf: bytes) -> Job:
+        now = time.time()
+        job = Job(uuid.uuid4().hex, QUEUED, document_type, filename, form, pdf,
+                  progress={"pagesDone": 0, "pageCount": None}, created_at=now, updated_at=now)
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, status, document_type, filename, form, pdf, progress, '
+                'created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (job.id, job.status, document_type, filename, json.dumps(form), pdf,
+                 json.dumps(job.progress), now, now)
+            )
+        return job
+
+    def get(self, job_id: str, with_pdf: bool = False) -> Optional[Job]:
+        columns = '*' if with_pdf else (
+            'id, status, document_type, filename, form, progress, result, error, owner_pid, '
+            'created_at, updated_at'
+        )
+        with self._connect() as conn:
+            row = conn.execute(f'SELECT {columns} FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row['id'],
+            status=row['status'],
+            document_type=row['document_type'],
+            filename=row['filename'],
+            form=json.loads(row['form']),
+            pdf=row['pdf'] if with_pdf else None,
+            progress=json.loads(row['progress']),
+            result=json.loads(row['result']) if row['result'] else None,
+            error=row['error'],
+            owner_pid=row['owner_pid'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+
+    def claim(self, job_id: str) -> bool:
+        """Mark a queued job as running in this process; False if someone else has it"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET status = ?, owner_pid = ?, updated_at = ? '
+                'WHERE id = ? AND status = ?',
+                (RUNNING, os.getpid(), time.time(), job_id, QUEUED)
+            )
+        return cursor.rowcount == 1
+
+    def set_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute('UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ?',
+                         (json.dumps(progress), time.time(), job_id))
+
+    def finish(self, job_id: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None) -> None:
+        """Store the outcome and drop the PDF, which is no longer needed"""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, pdf = NULL, updated_at = ? '
+                'WHERE id = ?',
+                (FAILED if error else DONE, json.dumps(result) if result is not None else None,
+                 error, time.time(), job_id)
+            )
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished jobs last updated before the given time; returns how many went"""
+        with self._connect() as conn:
+            cursor = conn.execute('DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?',
+                                  (DONE, FAILED, older_than))
+        return cursor.rowcount
+
+    def unfinished(self) -> List[str]:
+        """Queued jobs, plus running jobs whose owning process has gone away"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT id, status, owner_pid FROM jobs WHERE status IN (?, ?) ORDER BY created_at',
+                (QUEUED, RUNNING)
+            ).fetchall()
+            job_ids = []
+            for row in rows:
+                if row['status'] == RUNNING:
+                    if _process_alive(row['owner_pid']):
+                        continue
+                    conn.execute(
+                        'UPDATE jobs SET status = ?, owner_pid = NULL WHERE id = ? AND status = ?',
+                        (QUEUED, row['id'], RUNNING)
+                    )
+                job_ids.append(row['id'])
+        return job_ids
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    if not pid or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class JobQueue:
+    """Runs jobs from a JobStore on a fixed number of worker threads.
+
+    handler(job, progress) does the actual verification and returns the result;
+    progress(pages_done, page_count) records per-page progress. Threads start
+    lazily and are restarted after a fork, and start() re-queues any jobs an
+    earlier process left unfinished. Finished jobs are deleted retention
+    seconds after they finish (never when retention is 0), checked by the
+    workers every purge_interval seconds.
+    """
+
+    def __init__(self, store: JobStore,
+                 handler: Callable[[Job, Callable[[int, int], None]], Dict[str, Any]],
+                 workers: int = 2, poll_interval: float = 0.5, retention: float = 0,
+                 purge_interval: float = 600):
+        self.store = store
+        self.handler = handler
+        self.workers = max(workers, 1)
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._finished = threading.Condition()
+        self._owner_pid: Optional[int] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._owner_pid == os.getpid():
+                return
+            self._owner_pid = os.getpid()
+            self._queue = queue.Queue()
+            for n in range(self.workers):
+                threading.Thread(target=self._work, name=f"verify-job-{n}", daemon=True).start()
+            recovered = self.store.unfinished()
+        for job_id in recovered:
+            self._queue.put(job_id)
+        if recovered:
+            logger.info(f"Re-queued {len(recovered)} unfinished verification jobs")
+
+    def submit(self, document_type: str, filename: str, form: Dict[str, str], pdf: bytes) -> Job:
+        self.start()
+        job = self.store.create(document_type, filename, form, pdf)
+        self._queue.put(job.id)
+        logger.info(f"Queued verification job {job.id} ({document_type}, {filename})")
+        return job
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Job]:
+        """Long-poll: return the job once it has finished or timeout seconds have passed"""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.store.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job.status in FINISHED or remaining <= 0:
+                return job
+            # Jobs finished by this process wake us at once; others are seen on the next poll
+            with self._finished:
+                self._finished.wait(min(remaining, self.poll_interval))
+
+    def _purge_expired(self) -> None:
+        """Delete jobs past their retention, at most once per purge_interval across all workers"""
+        if self.retention <= 0:
+            return
+        with self._lock:
+            if time.monotonic() < self._next_purge:
+                return
+            self._next_purge = time.monotonic() + self.purge_interval
+        try:
+            purged = self.store.purge(time.time() - self.retention)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not purge old verification jobs: {str(e)}")
+            return
+        if purged:
+            logger.info(f"Purged {purged} verification jobs older than {self.retention:.0f}s")
+
+    def _work(self) -> None:
+        while True:
+            self._purge_expired()
+            try:
+                # Idle workers wake up now and then so old jobs are purged without new ones
+                timeout = self.purge_interval if self.retention > 0 else None
+                job_id = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if not self.store.claim(job_id):
+                continue
+            job = self.store.get(job_id, with_pdf=True)
+            started = time.perf_counter()
+
+            def progress(pages_done: int, page_count: int) -> None:
+                self.store.set_progress(job_id, {"pagesDone": pages_done, "pageCount": page_count})
+
+            try:
+                result = self.handler(job, progress)
+                self.store.finish(job_id, result=result)
+                elapsed = time.perf_counter() - started
+                logger.info(f"Verification job {job_id} done in {elapsed:.1f}s")
+            except Exception as e:
+                logger.error(f"Verification job {job_id} failed: {str(e)}", exc_info=True)
+                self.store.finish(job_id, error=str(e))
+            with self._finished:
+                self._finished.notify_all()
@@ -0,0 +1,194 @@
+# marker_scanner.py
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Match, Optional, Pattern, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Characters that can be part of a marker's literal prefix
+LITERAL_CHARS = re.compile(r"[A-Za-z0-9 ऀ-ॿ]")
+# A quantifier makes the character (or group) before it optional
+OPTIONAL_QUANTIFIERS = '?*{'
+MIN_ANCHOR_LENGTH = 2
+
+
+@dataclass
+class MarkerHit:
+    """Where a marker pattern first occurs"""
+    group: str
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+class MarkerScan:
+    """Markers found in one text, with lookups that mirror a loop over each group's pattern list.
+
+    Each marker's match is what pattern.search(text) would return. A marker
+    is only searched for when first looked up, so a loop that stops at its
+    first hit still skips the rest of its group, and a marker none of whose
+    literal prefixes occur in the text is never searched at all.
+    """
+
+    def __init__(self, text: str, scanner: 'MarkerScanner'):
+        self.text = text
+        self._scanner = scanner
+        self._first: Dict[Tuple[str, int], Optional[Match]] = {}
+        self._present: Dict[str, bool] = {}
+
+    def _has_prefix(self, prefixes: List[str]) -> bool:
+        for prefix in prefixes:
+            if prefix not in self._present:
+                self._present[prefix] = prefix in self.text
+            if self._present[prefix]:
+                return True
+        return False
+
+    def _match(self, group: str, index: int) -> Optional[Match]:
+        key = (group, index)
+        if key not in self._first:
+            prefixes = self._scanner.prefixes.get(key)
+            if prefixes is not None and not self._has_prefix(prefixes):
+                self._first[key] = None
+            else:
+                self._first[key] = self._scanner.groups[group][index].search(self.text)
+        return self._first[key]
+
+    @property
+    def hits(self) -> List[MarkerHit]:
+        """First occurrence of every marker present, ordered by position"""
+        hits = [
+            MarkerHit(group, index, match.start(), match.end(), match.group())
+            for group, patterns in self._scanner.groups.items()
+            for index in range(len(patterns))
+            for match in [self._match(group, index)] if match
+        ]
+        return sorted(hits, key=lambda hit: (hit.start, hit.group, hit.index))
+
+    def found(self, group: str) -> List[Pattern]:
+        """Patterns of the group that occur in the text, in list order"""
+        patterns = self._scanner.groups[group]
+        return [pattern for index, pattern in enumerate(patterns) if self._match(group, index)]
+
+    def matches(self, group: str) -> Iterator[Match]:
+        """The match of each pattern of the group that occurs, in list order; match.re is the pattern"""
+        for index in range(len(self._scanner.groups[group])):
+            match = self._match(group, index)
+            if match:
+                yield match
+
+    def count(self, group: str) -> int:
+        return len(self.found(group))
+
+    def counts(self) -> Dict[str, int]:
+        return {group: self.count(group) for group in self._scanner.groups}
+
+
+class MarkerScanner:
+    """Shared marker lookups over a validator's named groups of patterns.
+
+    Most markers start with a literal word (ELECTION for ELECTION\\s*COMMISSION,
+    RATION or राशन for RATION\\s*CARD|राशन\\s*कार्ड). Those prefixes are worked
+    out once here, and a scan checks them with a plain substring test before
+    running the marker's regex, which is what makes absent markers cheap.
+    Results are the same as searching for each marker separately.
+    """
+
+    def __init__(self, groups: Dict[str, List[Pattern]]):
+        self.groups = groups
+        # (group, index) -> literal prefixes, for markers that have them
+        self.prefixes: Dict[Tuple[str, int], List[str]] = {}
+        for group, patterns in groups.items():
+            for index, pattern in enumerate(patterns):
+                # Case-insensitive or verbose patterns do not match their source text literally
+                prefixes = _literal_prefixes(pattern.pattern) if pattern.flags == re.UNICODE else None
+                if prefixes is not None:
+                    self.prefixes[(group, index)] = prefixes
+
+    def scan(self, text: str) -> MarkerScan:
+        return MarkerScan(text, self)
+
+
+def _literal_prefixes(source: str) -> Optional[List[str]]:
+    """Literal strings one of which every match of the pattern starts with, or None"""
+    branches = _split_branches(source)
+    if len(branches) > 1:
+        # A top-level alternation: every branch needs prefixes of its own
+        return _branch_prefixes(branches)
+
+    if source.startswith(r'\b'):
+        source = source[2:]
+
+    if source.startswith('(?:') or (source.startswith('(') and not source.startswith('(?')):
+        # A leading group: whatever follows it, a match starts with one of its branches
+        body_start = 3 if source.startswith('(?:') else 1
+        end = _closing_paren(source)
+        if end is None or source[end + 1:end + 2] in tuple(OPTIONAL_QUANTIFIERS):
+            return None
+        return _branch_prefixes(_split_branches(source[body_start:end]))
+
+    length = 0
+    while length < len(source) and LITERAL_CHARS.match(source[length]):
+        length += 1
+    if source[length:length + 1] and source[length] in OPTIONAL_QUANTIFIERS:
+        length -= 1
+    prefix = source[:length]
+    return [prefix] if len(prefix) >= MIN_ANCHOR_LENGTH else None
+
+
+def _branch_prefixes(branches: List[str]) -> Optional[List[str]]:
+    prefixes = []
+    for branch in branches:
+        branch_prefixes = _literal_prefixes(branch)
+        if branch_prefixes is None:
+            return None
+        prefixes.extend(branch_prefixes)
+    return prefixes
+
+
+def _closing_paren(source: str) -> Optional[int]:
+    depth, i, in_class = 0, 0, False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return None
+
+
+def _split_branches(body: str) -> List[str]:
+    branches, depth, start, i, in_class = [], 0, 0, 0, False
+    while i < len(body):
+        char = body[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            branches.append(body[start:i])
+            start = i + 1
+        i += 1
+    branches.append(body[start:])
+    return branches
+
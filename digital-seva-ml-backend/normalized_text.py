@@ -0,0 +1,86 @@
+# normalized_text.py
+import logging
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Tuple, Union
+
+from identifier_extractor import DRIVING_LICENSE, EPIC, IFSC, PAN, IdentifierTable, extract_identifiers
+from ocr_normalizer import ConfusionNormalizer
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Anything that is not a word character or whitespace
+PUNCTUATION = re.compile(r'[^\w\s]')
+# Words in uppercased text, split where the script changes
+TOKEN = re.compile(r'[A-Z0-9]+|[ऀ-ॿ]+')
+LATIN = 'Latin'
+DEVANAGARI = 'Devanagari'
+# OCR confusions undone before looking for ID numbers
+ID_CONFUSIONS = ConfusionNormalizer([PAN, EPIC, IFSC, DRIVING_LICENSE])
+
+
+@dataclass(frozen=True)
+class Token:
+    """A word of the uppercased text, with its offsets in it"""
+    text: str
+    start: int
+    end: int
+    script: str
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A stretch of consecutive tokens in one script"""
+    script: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """The forms of one OCR text that validators read, each computed on first use.
+
+    Built once per request and passed to every validator it is checked
+    against, so auto-detection and retries uppercase, strip and scan for ID
+    numbers once. The forms are pure functions of raw and are cached on the
+    instance; a race between threads at worst computes one twice.
+    """
+    raw: str
+
+    @classmethod
+    def of(cls, text: Union[str, 'NormalizedText']) -> 'NormalizedText':
+        return text if isinstance(text, NormalizedText) else cls(text or "")
+
+    @cached_property
+    def upper(self) -> str:
+        return self.raw.upper()
+
+    @cached_property
+    def stripped(self) -> str:
+        """Uppercase, punctuation replaced by spaces and whitespace collapsed"""
+        return ' '.join(PUNCTUATION.sub(' ', self.upper).split())
+
+    @cached_property
+    def tokens(self) -> Tuple[Token, ...]:
+        return tuple(
+            Token(match.group(), match.start(), match.end(), DEVANAGARI if match.group()[0] > '\u007f' else LATIN)
+            for match in TOKEN.finditer(self.upper)
+        )
+
+    @cached_property
+    def segments(self) -> Tuple[Segment, ...]:
+        """Latin and Devanagari stretches of the uppercased text"""
+        segments = []
+        for token in self.tokens:
+            if segments and segments[-1].script == token.script:
+                segments[-1] = Segment(token.script, segments[-1].start, token.end)
+            else:
+                segments.append(Segment(token.script, token.start, token.end))
+        return tuple(segments)
+
+    @cached_property
+    def identifiers(self) -> IdentifierTable:
+        """Candidate ID numbers, after undoing OCR confusions; offsets are into upper"""
+        return extract_identifiers(ID_CONFUSIONS.normalize(self.upper))
@@ -0,0 +1,147 @@
+# ocr_cache.py
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class OCRCache:
+    """Content-addressed cache of extracted text.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus the OCR pipeline
+    version, so re-uploads of the same file skip OCR entirely. A bounded LRU
+    lives in memory; a size-capped directory (shared between processes) backs it.
+    """
+
+    def __init__(self, pipeline_version: str, max_entries: int = 256,
+                 disk_dir: Optional[str] = None, disk_max_bytes: int = 256 * 1024 * 1024):
+        self.pipeline_version = pipeline_version
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self.counters = {
+            'memoryHits': 0,
+            'diskHits': 0,
+            'misses': 0,
+            'memoryEvictions': 0,
+            'diskEvictions': 0
+        }
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(f.stat().st_size for f in self.disk_dir.glob('*/*.txt'))
+
+    def key(self, digest: str, *variant: str) -> str:
+        """Build the cache key from an upload's SHA-256; variant carries any per-request OCR options"""
+        return ':'.join((digest, self.pipeline_version) + variant)
+
+    def _disk_path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.disk_dir / name[:2] / f"{name}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.counters['memoryHits'] += 1
+                return self._memory[key]
+
+        text = self._disk_get(key)
+        with self._lock:
+            if text is None:
+                self.counters['misses'] += 1
+                return None
+            self.counters['diskHits'] += 1
+            self._memory_put(key, text)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory_put(key, text)
+        self._disk_put(key, text)
+
+    def _memory_put(self, key: str, text: str) -> None:
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters['memoryEvictions'] += 1
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+            os.utime(path)  # Refresh mtime so eviction stays least-recently-used
+            return text
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading OCR cache entry {path}: {str(e)}")
+            return None
+
+    def _disk_put(self, key: str, text: str) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Write atomically so concurrent workers never read a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing OCR cache entry {path}: {str(e)}")
+            return
+
+        with self._lock:
+            self._disk_bytes += path.stat().st_size
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Drop least recently used files until the disk tier fits its cap"""
+        entries = []
+        for f in self.disk_dir.glob('*/*.txt'):
+            try:
+                stat = f.stat()
+            except FileNotFoundError:  # Removed by another worker
+                continue
+            entries.append((stat.st_mtime, stat.st_size, f))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, f in entries:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                f.unlink()
+                self.counters['diskEvictions'] += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._disk_bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters['memoryHits'] + self.counters['diskHits'] + self.counters['misses']
+            hits = lookups - self.counters['misses']
+            return {
+                **self.counters,
+                'hitRate': hits / lookups if lookups else 0.0,
+                'memoryEntries': len(self._memory),
+                'diskBytes': self._disk_bytes,
+                'pipelineVersion': self.pipeline_version
+            }
@@ -0,0 +1,194 @@
+# ocr_engines.py
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # C API bindings are optional; fall back to the tesseract CLI
+    tesserocr = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class OCRTimeoutError(RuntimeError):
+    """Raised when a page does not finish OCR within the configured timeout"""
+
+
+@dataclass
+class ScriptInfo:
+    """Tesseract orientation and script detection (OSD) result for a page"""
+    script: str
+    script_conf: float
+    # Degrees to rotate the page clockwise to make it upright
+    rotate: int = 0
+    orientation_conf: float = 0.0
+
+
+class PytesseractEngine:
+    """Subprocess engine: one tesseract process (and model load) per call"""
+    name = 'pytesseract'
+
+    def __init__(self):
+        self._languages: Optional[Set[str]] = None
+
+    def available_languages(self) -> Set[str]:
+        if self._languages is None:
+            self._languages = set(pytesseract.get_languages(config=''))
+        return self._languages
+
+    def detect_script(self, image: np.ndarray) -> Optional[ScriptInfo]:
+        try:
+            osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+        except pytesseract.TesseractError as e:  # Too little text, or no osd.traineddata
+            logger.debug(f"Script detection failed: {str(e)}")
+            return None
+        return ScriptInfo(osd['script'], float(osd['script_conf']),
+                          int(osd['rotate']), float(osd['orientation_conf']))
+
+    def image_to_string(self, image: np.ndarray, lang: str, config: str = '', timeout: float = 0) -> str:
+        return pytesseract.image_to_string(image, lang=lang, config=config, timeout=timeout)
+
+    def image_to_data(self, image: np.ndarray, lang: str, config: str = '',
+                      timeout: float = 0) -> Tuple[str, List[Tuple[str, float]]]:
+        """Return the page text and its (word, confidence) pairs from a single run"""
+        data = pytesseract.image_to_data(
+            image, lang=lang, config=config, timeout=timeout,
+            output_type=pytesseract.Output.DICT
+        )
+        lines = {}
+        words = []
+        for i, word in enumerate(data['text']):
+            conf = float(data['conf'][i])
+            if not word.strip() or conf < 0:
+                continue
+            line_key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines.setdefault(line_key, []).append(word)
+            words.append((word, conf))
+        text = "\n".join(" ".join(line) for line in lines.values())
+        return text, words
+
+
+class TesserocrEngine:
+    """In-process engine that keeps initialized Tesseract APIs alive between calls.
+
+    APIs are pooled per language set; each one serves a single call at a time,
+    so concurrent threads in one process each get their own instance.
+    """
+    name = 'tesserocr'
+
+    def __init__(self, tessdata_path: Optional[str] = None):
+        self.tessdata_path = tessdata_path
+        self._pools: Dict[str, queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+        self._languages: Optional[Set[str]] = None
+
+    def available_languages(self) -> Set[str]:
+        if self._languages is None:
+            if self.tessdata_path:
+                self._languages = set(tesserocr.get_languages(self.tessdata_path)[1])
+            else:
+                self._languages = set(tesserocr.get_languages()[1])
+        return self._languages
+
+    def _create_api(self, lang: str):
+        # Language packs load lazily, on the first page that needs them
+        logger.info(f"Loading Tesseract model '{lang}' in process {os.getpid()}")
+        if self.tessdata_path:
+            return tesserocr.PyTessBaseAPI(path=self.tessdata_path, lang=lang)
+        return tesserocr.PyTessBaseAPI(lang=lang)
+
+    @contextmanager
+    def _acquire(self, lang: str):
+        with self._lock:
+            pool = self._pools.setdefault(lang, queue.LifoQueue())
+        try:
+            api = pool.get_nowait()
+        except queue.Empty:
+            api = self._create_api(lang)
+        try:
+            yield api
+        finally:
+            api.Clear()
+            pool.put(api)
+
+    def _set_image(self, api, image: np.ndarray) -> None:
+        # Hand the numpy buffer straight to Tesseract instead of encoding an image file
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, image.strides[0])
+
+    def _apply_config(self, api, config: str) -> None:
+        # Only the page segmentation mode is passed through config in this codebase
+        api.SetPageSegMode(tesserocr.PSM.AUTO)
+        parts = config.split()
+        if '--psm' in parts:
+            api.SetPageSegMode(int(parts[parts.index('--psm') + 1]))
+
+    def _recognize(self, api, timeout: float) -> None:
+        # Tesseract checks the deadline between words and abandons the page once it passes
+        if timeout > 0 and not api.Recognize(int(timeout * 1000)):
+            raise OCRTimeoutError(f"Tesseract did not finish the page within {timeout}s")
+
+    def image_to_string(self, image: np.ndarray, lang: str, config: str = '', timeout: float = 0) -> str:
+        with self._acquire(lang) as api:
+            self._apply_config(api, config)
+            self._set_image(api, image)
+            self._recognize(api, timeout)
+            return api.GetUTF8Text()
+
+    def image_to_data(self, image: np.ndarray, lang: str, config: str = '',
+                      timeout: float = 0) -> Tuple[str, List[Tuple[str, float]]]:
+        """Return the page text and its (word, confidence) pairs from a single recognition"""
+        with self._acquire(lang) as api:
+            self._apply_config(api, config)
+            self._set_image(api, image)
+            self._recognize(api, timeout)
+            text = api.GetUTF8Text()
+            words = [(word, float(conf)) for word, conf in api.MapWordConfidences() if word.strip()]
+            return text, words
+
+    def detect_script(self, image: np.ndarray) -> Optional[ScriptInfo]:
+        with self._acquire('osd') as api:
+            api.SetPageSegMode(tesserocr.PSM.OSD_ONLY)
+            self._set_image(api, image)
+            osd = api.DetectOrientationScript()
+        if not osd:
+            return None
+        return ScriptInfo(osd['script_name'], float(osd['script_conf']),
+                          (360 - osd['orient_deg']) % 360, float(osd['orient_conf']))
+
+
+_engine = None
+_engine_pid = None
+
+
+def get_engine():
+    """Return this process's OCR engine, creating it on first use.
+
+    OCR_ENGINE selects 'tesserocr', 'pytesseract' or 'auto' (tesserocr when
+    its bindings are importable, otherwise the pytesseract subprocess path).
+    """
+    global _engine, _engine_pid
+    if _engine is not None and _engine_pid == os.getpid():
+        return _engine
+
+    choice = os.environ.get('OCR_ENGINE', 'auto').lower()
+    if choice in ('auto', 'tesserocr') and tesserocr is not None:
+        _engine = TesserocrEngine(os.environ.get('TESSDATA_PREFIX'))
+    else:
+        if choice == 'tesserocr':
+            logger.warning("tesserocr is not installed; falling back to pytesseract")
+        _engine = PytesseractEngine()
+    _engine_pid = os.getpid()
+    logger.info(f"Using OCR engine: {_engine.name}")
+    return _engine
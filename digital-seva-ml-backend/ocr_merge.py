@@ -0,0 +1,77 @@
+# ocr_merge.py
+import logging
+from difflib import SequenceMatcher
+from typing import List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# A word only one pass read is kept from this confidence up; unknown confidences are kept
+MIN_ONE_SIDED_CONFIDENCE = 50.0
+
+# word, confidence (None when the engine gave none for it), starts a line
+Token = Tuple[str, Optional[float], bool]
+
+
+def _tokens(text: str, words: List[Tuple[str, float]]) -> List[Token]:
+    """Words of a pass's text in reading order, with the engine's confidence where it lines up"""
+    tokens = []
+    next_word = 0
+    for line in text.splitlines():
+        for i, word in enumerate(line.split()):
+            conf = None
+            if next_word < len(words) and words[next_word][0] == word:
+                conf = words[next_word][1]
+                next_word += 1
+            tokens.append((word, conf, i == 0))
+    return tokens
+
+
+def _confidence(token: Token) -> float:
+    return token[1] if token[1] is not None else -1.0
+
+
+def _mean_confidence(tokens: List[Token]) -> float:
+    confs = [conf for _, conf, _ in tokens if conf is not None]
+    return sum(confs) / len(confs) if confs else -1.0
+
+
+def _keep_one_sided(tokens: List[Token]) -> List[Token]:
+    return [token for token in tokens if token[1] is None or token[1] >= MIN_ONE_SIDED_CONFIDENCE]
+
+
+def merge_passes(text1: str, words1: List[Tuple[str, float]],
+                 text2: str, words2: List[Tuple[str, float]]) -> str:
+    """One consensus text from two OCR passes over the same page.
+
+    The passes are aligned word by word with difflib. Words both read the
+    same are kept once. Where they differ, the more confident reading wins:
+    word for word when both read as many words there, otherwise the side
+    with the higher mean confidence, with ties going to the first pass.
+    Words only one pass read are kept when confident enough. Line breaks
+    follow the pass each word came from.
+    """
+    tokens1, tokens2 = _tokens(text1, words1), _tokens(text2, words2)
+    matcher = SequenceMatcher(None, [token[0] for token in tokens1], [token[0] for token in tokens2],
+                              autojunk=False)
+    merged: List[Token] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        first, second = tokens1[i1:i2], tokens2[j1:j2]
+        if tag == 'equal':
+            merged.extend(first)
+        elif tag == 'delete':
+            merged.extend(_keep_one_sided(first))
+        elif tag == 'insert':
+            merged.extend(_keep_one_sided(second))
+        elif len(first) == len(second):
+            merged.extend(b if _confidence(b) > _confidence(a) else a for a, b in zip(first, second))
+        else:
+            merged.extend(second if _mean_confidence(second) > _mean_confidence(first) else first)
+
+    logger.debug(f"Merged OCR passes: {len(tokens1)} + {len(tokens2)} words -> {len(merged)}")
+    parts = []
+    for word, _, starts_line in merged:
+        if parts:
+            parts.append("\n" if starts_line else " ")
+        parts.append(word)
+    return "".join(parts)
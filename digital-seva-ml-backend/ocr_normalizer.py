@@ -0,0 +1,107 @@
+# ocr_normalizer.py
+import logging
+import re
+from typing import Dict, Iterable, List, Match, Optional, Pattern, Tuple
+
+from identifier_extractor import DRIVING_LICENSE, EPIC, IFSC, PAN
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Letters OCR reads for digits, and the other way round
+TO_DIGIT = {'O': '0', 'I': '1', 'Z': '2', 'S': '5', 'G': '6', 'T': '7', 'B': '8'}
+TO_LETTER = {digit: letter for letter, digit in TO_DIGIT.items()}
+
+# Slots of an identifier as printed: L a letter, D a digit, A either
+LETTER, DIGIT, ANY = 'L', 'D', 'A'
+SLOT_CLASSES = {
+    LETTER: '[A-Z' + ''.join(TO_LETTER) + ']',
+    DIGIT: '[0-9' + ''.join(TO_DIGIT) + ']',
+    ANY: '[A-Z0-9]'
+}
+SLOT_TABLES = {
+    LETTER: str.maketrans(TO_LETTER),
+    DIGIT: str.maketrans(TO_DIGIT)
+}
+
+# kind -> slot layouts of the runs it is printed in, as read by the identifier extractor
+SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    # ABCPE1234F
+    PAN: ('LLLLLDDDDL',),
+    # ABC1234567
+    EPIC: ('LLLDDDDDDD',),
+    # SBIN0001234
+    IFSC: ('LLLLDAAAAAA',),
+    # MH1220110012345, MH122011001234, MH12 20110012345
+    DRIVING_LICENSE: ('LLDDDDDDDDDDDDD', 'LLDDDDDDDDDD', 'LLDD', 'DDDDDDDDDDD')
+}
+
+
+class ConfusionNormalizer:
+    """Undoes OCR letter/digit confusions in runs shaped like an identifier.
+
+    Each schema slot is either a letter or a digit, so O/0, I/1, S/5 and the
+    like are only swapped where the official format says the other one
+    belongs: ABCPE1Z34F becomes ABCPE1234F, and the letters of a real PAN are
+    left alone. A run fits a layout when every slot holds its kind or a
+    confusion of it, and no more than one slot or half of each stretch of
+    letter or digit slots is wrong, so a number is not read as letters. When a run fits
+    several layouts (a PAN and an EPIC are both ten long), the one needing
+    the fewest swaps wins. Only runs that mix letters and digits and have a layout's
+    length are looked at, all in one re.sub pass over the text. Every swap
+    is one character for one, so positions in the output match the input.
+    Expects uppercase text.
+    """
+
+    def __init__(self, kinds: Iterable[str]):
+        # Run length -> [(layout regex, segments)], in the order the kinds were given
+        self._layouts: Dict[int, List[Tuple[Pattern, List[Tuple[int, int, str]]]]] = {}
+        for layout in dict.fromkeys(layout for kind in kinds for layout in SCHEMAS[kind]):
+            segments = self._split(layout)
+            regex = re.compile(''.join(f'{SLOT_CLASSES[slot]}{{{end - start}}}' for start, end, slot in segments))
+            self._layouts.setdefault(len(layout), []).append((regex, segments))
+        lengths = '|'.join(f'[A-Z0-9]{{{length}}}' for length in sorted(self._layouts, reverse=True))
+        self.pattern = re.compile(rf'(?<![A-Z0-9])(?=[A-Z]*[0-9])(?=[0-9]*[A-Z])(?:{lengths})(?![A-Z0-9])')
+
+    @staticmethod
+    def _split(layout: str) -> List[Tuple[int, int, str]]:
+        """Stretches of same-kind slots in a layout"""
+        segments = []
+        start = 0
+        for end in range(1, len(layout) + 1):
+            if end == len(layout) or layout[end] != layout[start]:
+                segments.append((start, end, layout[start]))
+                start = end
+        return segments
+
+    @staticmethod
+    def _wrong_slots(run: str, segments: List[Tuple[int, int, str]]) -> Optional[int]:
+        """How many slots hold the other kind, or None when too many do"""
+        total = 0
+        for start, end, slot in segments:
+            if slot == ANY:
+                continue
+            wrong = sum(c.isdigit() if slot == LETTER else c.isalpha() for c in run[start:end])
+            if wrong > 1 and 2 * wrong > end - start:
+                return None
+            total += wrong
+        return total
+
+    def _fix(self, match: Match) -> str:
+        run = match.group()
+        best, fewest = None, None
+        for regex, segments in self._layouts[len(run)]:
+            if not regex.fullmatch(run):
+                continue
+            wrong = self._wrong_slots(run, segments)
+            if wrong is not None and (fewest is None or wrong < fewest):
+                best, fewest = segments, wrong
+        if best is None:
+            return run
+        return ''.join(
+            run[start:end] if slot == ANY else run[start:end].translate(SLOT_TABLES[slot])
+            for start, end, slot in best
+        )
+
+    def normalize(self, text: str) -> str:
+        return self.pattern.sub(self._fix, text)
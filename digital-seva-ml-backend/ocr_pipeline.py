@@ -0,0 +1,246 @@
+# ocr_pipeline.py
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pytesseract
+
+from ocr_engines import OCRTimeoutError, get_engine
+from ocr_merge import merge_passes
+from preprocessing import run_pipeline
+from script_router import route_page
+from text_regions import detect_text_regions
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+OCR_LANG = 'eng+hin'
+
+# Bump whenever preprocessing or OCR settings change so cached texts are not reused
+PIPELINE_VERSION = '3'
+
+
+def _init_worker(tesseract_cmd: str) -> None:
+    """Propagate the Tesseract location into pool workers (needed for spawn) and load the engine"""
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    get_engine()
+
+
+@dataclass
+class OCROptions:
+    """Per-request OCR settings, shipped to pool workers with each page"""
+    # 'dual' always runs both passes; 'gated' runs the grayscale pass only for weak pages
+    mode: str = 'gated'
+    min_confidence: float = 60.0
+    min_words: int = 10
+    # Use an embedded PDF text layer instead of OCR when it scores as usable
+    text_layer: bool = True
+    # Named preprocessing pipeline from preprocessing.PIPELINES
+    pipeline: str = 'default'
+    # OCR only detected text blocks instead of the full page
+    text_regions: bool = False
+    # Pick each page's language models from its detected script instead of OCR_LANG
+    script_routing: bool = False
+
+    def cache_variant(self) -> Tuple[str, ...]:
+        """Options that change the extracted text, for use in OCR cache keys"""
+        return (self.mode, f"min_confidence={self.min_confidence:g}", f"min_words={self.min_words}",
+                f"text_layer={int(self.text_layer)}", self.pipeline,
+                f"text_regions={int(self.text_regions)}", f"script_routing={int(self.script_routing)}")
+
+
+@dataclass
+class PageResult:
+    """Text of one page plus how it was obtained"""
+    text: str
+    path: str
+    mean_confidence: Optional[float] = None
+    word_count: Optional[int] = None
+    pipeline: Optional[str] = None
+    # Milliseconds spent in each preprocessing stage
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Number of text blocks OCRed, when text-region detection was used
+    regions: Optional[int] = None
+    lang: Optional[str] = None
+    # Script detected by OSD, when script routing was used
+    script: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'meanConfidence': self.mean_confidence,
+            'wordCount': self.word_count,
+            'pipeline': self.pipeline,
+            'timings': self.timings,
+            'regions': self.regions,
+            'lang': self.lang,
+            'script': self.script
+        }
+
+
+def normalize_page(page: np.ndarray, timings: Dict[str, float]) -> np.ndarray:
+    """Return the page as grayscale at no less than the minimum OCR height.
+
+    Pages normally arrive that way from the renderer; colour or undersized
+    pages (e.g. from callers that rendered them differently) are converted here.
+    """
+    started = time.perf_counter()
+    gray = page
+    # Convert to grayscale
+    if gray.ndim == 3:
+        gray = cv2.cvtColor(gray, cv2.COLOR_RGB2GRAY)
+
+    # Resize if too small
+    height = gray.shape[0]
+    if height < 1000:
+        scale = 1000/height
+        gray = cv2.resize(gray, None, fx=scale, fy=scale)
+    timings['normalize'] = round((time.perf_counter() - started) * 1000, 2)
+    return gray
+
+
+def _image_to_data(engine, crops: List[np.ndarray], lang: str, config: str,
+                   timeout: float) -> Tuple[str, List[Tuple[str, float]]]:
+    texts, words = [], []
+    for crop in crops:
+        text, crop_words = engine.image_to_data(crop, lang, config=config, timeout=timeout)
+        texts.append(text)
+        words.extend(crop_words)
+    return "\n".join(texts), words
+
+
+def ocr_page(page: np.ndarray, options: OCROptions, timeout: float = 0) -> PageResult:
+    """Preprocess a single rendered page and extract its text"""
+    timings = {}
+    gray = normalize_page(page, timings)
+    engine = get_engine()
+
+    # Load only the language models the page's script needs, and turn it upright
+    lang, script = OCR_LANG, None
+    if options.script_routing:
+        started = time.perf_counter()
+        gray, lang, script_info = route_page(engine, gray, OCR_LANG)
+        script = script_info.script if script_info else None
+        timings['script_detection'] = round((time.perf_counter() - started) * 1000, 2)
+
+    # When enabled, only text blocks are preprocessed and OCRed, then merged in reading order
+    regions = None
+    if options.text_regions:
+        started = time.perf_counter()
+        regions = detect_text_regions(gray)
+        timings['text_regions'] = round((time.perf_counter() - started) * 1000, 2)
+
+    if regions is None:
+        gray_crops, config, region_count = [gray], '', None
+    else:
+        # Crops hold a single block of text, which PSM 6 reads without layout analysis
+        gray_crops = [gray[y:y + h, x:x + w] for x, y, w, h in regions]
+        config, region_count = '--psm 6', len(regions)
+    processed_crops = [run_pipeline(crop, options.pipeline, timings) for crop in gray_crops]
+
+    if options.mode == 'dual':
+        # Apply both preprocessing variants and merge their words into one text
+        text1, words1 = _image_to_data(engine, processed_crops, lang, config, timeout)
+        text2, words2 = _image_to_data(engine, gray_crops, lang, config, timeout)
+        return PageResult(merge_passes(text1, words1, text2, words2) + "\n", 'dual',
+                          pipeline=options.pipeline, timings=timings, regions=region_count,
+                          lang=lang, script=script)
+
+    # Gated: one pass with word confidences, second variant only for weak pages
+    text1, words = _image_to_data(engine, processed_crops, lang, config, timeout)
+    mean_confidence = sum(conf for _, conf in words) / len(words) if words else 0.0
+    if mean_confidence >= options.min_confidence and len(words) >= options.min_words:
+        return PageResult(text1 + "\n", 'single', round(mean_confidence, 2), len(words),
+                          options.pipeline, timings, region_count, lang, script)
+
+    logger.debug(
+        f"Weak page (confidence {mean_confidence:.1f}, {len(words)} words); running grayscale pass"
+    )
+    text2, words2 = _image_to_data(engine, gray_crops, lang, config, timeout)
+    return PageResult(merge_passes(text1, words, text2, words2) + "\n", 'fallback',
+                      round(mean_confidence, 2), len(words), options.pipeline, timings, region_count, lang, script)
+
+
+class PageOCRPool:
+    """Fans page OCR out over a process pool and joins the results back in page order"""
+
+    def __init__(self, max_workers: int = 1, page_timeout: Optional[float] = None):
+        self.max_workers = max(1, int(max_workers))
+        self.page_timeout = page_timeout
+        self._executor = None
+        self._owner_pid = None
+        # Request, job and batch threads all share one pool
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # Pools do not survive a fork, so a forked server worker builds its own
+            if self._executor is None or self._owner_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(pytesseract.pytesseract.tesseract_cmd,)
+                )
+                self._owner_pid = os.getpid()
+                logger.info(f"Started OCR pool with {self.max_workers} workers")
+            return self._executor
+
+    def imap_pages(self, pages: Iterable[np.ndarray], options: OCROptions) -> Iterator[PageResult]:
+        """OCR pages as they arrive and yield the results in their original order.
+
+        At most max_workers pages are in flight, so a lazily rendered page stream
+        keeps only a handful of page images alive at any time.
+        """
+        if self.max_workers == 1:
+            # Serial path: let pytesseract enforce the timeout on each pass
+            for page in pages:
+                yield ocr_page(page, options, self.page_timeout or 0)
+            return
+
+        executor = self._get_executor()
+        pending = deque()
+        page_number = 0
+        try:
+            for page in pages:
+                # Tesseract in the worker enforces the timeout too, so a stuck page frees its worker
+                pending.append(executor.submit(ocr_page, page, options, self.page_timeout or 0))
+                del page
+                if len(pending) >= self.max_workers:
+                    page_number += 1
+                    yield self._result(pending.popleft(), page_number)
+            while pending:
+                page_number += 1
+                yield self._result(pending.popleft(), page_number)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _result(self, future, page_number: int) -> PageResult:
+        try:
+            return future.result(timeout=self.page_timeout)
+        except FutureTimeoutError:
+            raise OCRTimeoutError(
+                f"OCR of page {page_number} exceeded {self.page_timeout}s"
+            )
+
+    def warm_up(self, options: OCROptions) -> None:
+        """OCR a tiny synthetic page on every worker so the first real page skips cold-start costs"""
+        started = time.perf_counter()
+        page = np.full((60, 240), 255, np.uint8)
+        cv2.putText(page, 'Warm up 123', (8, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.9, 0, 2)
+        # One page per worker; tiny pages finish before any worker can take a second one
+        for _ in self.imap_pages([page] * self.max_workers, options):
+            pass
+        logger.info(f"Warmed up {self.max_workers} OCR workers in {time.perf_counter() - started:.2f}s")
+
+    def shutdown(self) -> None:
+        if self._executor is not None and self._owner_pid == os.getpid():
+            self._executor.shutdown(cancel_futures=True)
+        self._executor = None
@@ -0,0 +1,74 @@
+# pattern_registry.py
+import logging
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class PatternRegistry:
+    """Regexes compiled once at import time, with their flags, grouped by owner.
+
+    The owning module calls freeze() once it has loaded; compiling after that
+    raises, so no pattern can be rebuilt per request without it showing up.
+    """
+
+    def __init__(self):
+        self._patterns: Dict[str, Dict[str, Pattern]] = {}
+        self._frozen = False
+
+    def compile(self, owner: str, name: str, pattern: str, flags: int = 0) -> Pattern:
+        if self._frozen:
+            raise RuntimeError(f"Pattern '{owner}/{name}' compiled after the registry was frozen")
+        patterns = self._patterns.setdefault(owner, {})
+        if name in patterns:
+            raise ValueError(f"Pattern '{owner}/{name}' is already registered")
+        patterns[name] = re.compile(pattern, flags)
+        return patterns[name]
+
+    def compile_list(self, owner: str, name: str, patterns: List[str], flags: int = 0) -> List[Pattern]:
+        """Compile an ordered list of alternatives, registered as name[0], name[1], ..."""
+        return [self.compile(owner, f"{name}[{i}]", pattern, flags) for i, pattern in enumerate(patterns)]
+
+    def compile_dict(self, owner: str, patterns: Dict[str, str], flags: int = 0) -> Dict[str, Pattern]:
+        """Compile named patterns, keeping their order"""
+        return {name: self.compile(owner, name, pattern, flags) for name, pattern in patterns.items()}
+
+    def freeze(self) -> None:
+        self._frozen = True
+        logger.debug(f"Pattern registry frozen with {self.count()} patterns")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def count(self, owner: Optional[str] = None) -> int:
+        if owner is not None:
+            return len(self._patterns.get(owner, {}))
+        return sum(len(patterns) for patterns in self._patterns.values())
+
+    def owners(self) -> List[str]:
+        return list(self._patterns)
+
+    def items(self, owner: Optional[str] = None) -> Iterator[Tuple[str, str, Pattern]]:
+        """(owner, name, compiled pattern) for every registered pattern"""
+        for name in [owner] if owner is not None else self.owners():
+            for key, compiled in self._patterns.get(name, {}).items():
+                yield name, key, compiled
+
+    def listing(self, owner: Optional[str] = None) -> Dict[str, List[Dict[str, object]]]:
+        """Each owner's compiled patterns with their source text and flags"""
+        owners = [owner] if owner is not None else self.owners()
+        return {
+            name: [
+                {"name": key, "pattern": compiled.pattern, "flags": _flag_names(compiled.flags)}
+                for key, compiled in self._patterns.get(name, {}).items()
+            ]
+            for name in owners
+        }
+
+
+def _flag_names(flags: int) -> List[str]:
+    # re.UNICODE is implied for str patterns and not worth listing
+    return [flag.name for flag in (re.IGNORECASE, re.VERBOSE, re.MULTILINE, re.DOTALL) if flags & flag]
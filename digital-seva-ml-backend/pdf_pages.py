@@ -0,0 +1,183 @@
+# pdf_pages.py
+import logging
+import re
+import statistics
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pdf2image
+import pdfplumber
+
+from uploads import UploadedPDF
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CID_PATTERN = re.compile(r'\(cid:\d+\)')
+TEXT_LAYER_PUNCTUATION = set(".,:;/-()'\"&%#@+*!?[]_₹|")
+
+
+@dataclass
+class PageInfo:
+    """Geometry of one PDF page (in points) and its usable embedded text, if any"""
+    number: int
+    width: Optional[float] = None
+    height: Optional[float] = None
+    text: Optional[str] = None
+    # Median glyph height in points, when the page has a text layer of any quality
+    text_height: Optional[float] = None
+    # Resolution of the largest embedded image, i.e. the scan DPI of scanned pages
+    native_dpi: Optional[float] = None
+
+
+@dataclass
+class RenderSettings:
+    """How pages are rasterized for OCR"""
+    # Fallback DPI when neither glyph sizes nor a scan resolution are known
+    dpi: int = 200
+    # Glyph height in pixels that Tesseract reads best
+    target_text_height: int = 32
+    # Pages are never rendered shorter than this (the old upscale threshold)
+    min_page_height: int = 1000
+    min_dpi: int = 72
+    max_dpi: int = 400
+    max_pixels: int = 0
+
+    def cache_variant(self) -> Tuple[str, ...]:
+        """Settings that change the rendered pages, and so their OCR text, for use in OCR cache keys"""
+        return tuple(f"{name}={value}" for name, value in asdict(self).items())
+
+
+def score_text_layer(text: str) -> float:
+    """Fraction of non-space characters in a text layer that look like real text.
+
+    Unmapped glyphs (pdfminer's "(cid:NN)" placeholders) and stray symbols from
+    broken font encodings count against the score.
+    """
+    unmapped = len(CID_PATTERN.findall(text))
+    chars = [c for c in CID_PATTERN.sub('', text) if not c.isspace()]
+    if not chars:
+        return 0.0
+    good = sum(
+        1 for c in chars
+        if c.isalnum() or c in TEXT_LAYER_PUNCTUATION or '\u0900' <= c <= '\u097f'  # Devanagari
+    )
+    return good / (len(chars) + unmapped)
+
+
+def count_pages(upload: UploadedPDF) -> int:
+    """Number of pages, read from the page tree without touching their content"""
+    try:
+        with upload.open() as pdf_file, pdfplumber.open(pdf_file) as pdf:
+            return len(pdf.pages)
+    except Exception as e:
+        logger.warning(f"Could not read PDF with pdfplumber: {str(e)}")
+        return pdf2image.pdfinfo_from_path(upload.path)['Pages']
+
+
+def inspect_pages(upload: UploadedPDF, read_text: bool = True, min_chars: int = 50,
+                  min_quality: float = 0.9, max_pages: Optional[int] = None) -> Tuple[List[PageInfo], int]:
+    """Collect page sizes and, when read_text is set, any usable embedded text.
+
+    Only the first max_pages pages are looked at; the document's total page
+    count is returned alongside them. Pages whose text layer is missing or
+    scores below the thresholds keep text=None and still need OCR. If
+    pdfplumber cannot parse the file, only the page count is taken from
+    poppler and every page is left for OCR.
+    """
+    pages = []
+    try:
+        with upload.open() as pdf_file, pdfplumber.open(pdf_file) as pdf:
+            page_count = len(pdf.pages)
+            for page_number, page in enumerate(pdf.pages[:max_pages], start=1):
+                info = PageInfo(page_number, float(page.width), float(page.height))
+                info.text_height = _median_text_height(page)
+                info.native_dpi = _native_dpi(page)
+                if read_text:
+                    text = page.extract_text() or ""
+                    char_count = sum(1 for c in text if not c.isspace())
+                    quality = score_text_layer(text)
+                    if char_count >= min_chars and quality >= min_quality:
+                        logger.debug(f"Page {page_number}: using text layer ({char_count} chars, quality {quality:.2f})")
+                        info.text = text
+                    else:
+                        logger.debug(f"Page {page_number}: text layer unusable ({char_count} chars, quality {quality:.2f})")
+                page.close()
+                pages.append(info)
+    except Exception as e:
+        logger.warning(f"Could not read PDF with pdfplumber: {str(e)}")
+        page_count = pdf2image.pdfinfo_from_path(upload.path)['Pages']
+        inspected = min(page_count, max_pages) if max_pages is not None else page_count
+        return [PageInfo(number) for number in range(1, inspected + 1)], page_count
+    return pages, page_count
+
+
+def _median_text_height(page) -> Optional[float]:
+    heights = [char['height'] for char in page.chars if char.get('text', '').strip() and char['height'] > 0]
+    return statistics.median(heights) if heights else None
+
+
+def _native_dpi(page) -> Optional[float]:
+    images = [image for image in page.images if image.get('srcsize') and image['height'] > 0]
+    if not images:
+        return None
+    largest = max(images, key=lambda image: image['width'] * image['height'])
+    return largest['srcsize'][1] / (largest['height'] / 72)
+
+
+def render_dpi(info: PageInfo, settings: RenderSettings) -> int:
+    """Work out the DPI that puts this page's text at the OCR target height.
+
+    Glyph sizes from the text layer give the text height directly, so the page
+    can be rendered larger or smaller as needed. Scanned pages are rendered at
+    their scan resolution, since going above it adds pixels but no detail.
+    """
+    if info.text_height:
+        dpi = settings.target_text_height * 72 / info.text_height
+    elif info.native_dpi:
+        dpi = info.native_dpi
+    else:
+        dpi = settings.dpi
+
+    if info.height:
+        # Never go below the minimum page height the preprocessing expects
+        dpi = max(dpi, settings.min_page_height * 72 / info.height)
+    dpi = min(max(dpi, settings.min_dpi), settings.max_dpi)
+
+    if info.width and info.height and settings.max_pixels:
+        pixels = (info.width * dpi / 72) * (info.height * dpi / 72)
+        if pixels > settings.max_pixels:
+            dpi = dpi * (settings.max_pixels / pixels) ** 0.5
+            logger.debug(f"Page {info.number}: capping render DPI at {int(dpi)}")
+    return max(int(dpi), 1)
+
+
+def iter_rendered_pages(upload: UploadedPDF, pages: Iterable[PageInfo],
+                        settings: RenderSettings) -> Iterator[np.ndarray]:
+    """Render pages one at a time, in grayscale at their OCR resolution.
+
+    Each page is rendered once and handed out as a single-channel array, so
+    preprocessing needs no colour conversion or resize.
+    """
+    for info in pages:
+        dpi = render_dpi(info, settings)
+        logger.debug(f"Rendering page {info.number} at {dpi} DPI")
+        image = pdf2image.convert_from_path(
+            upload.path,  # Written to a private temporary file on first use
+            dpi=dpi,
+            grayscale=True,
+            first_page=info.number,
+            last_page=info.number
+        )[0]
+        page = np.asarray(image)
+        image.close()
+        del image
+
+        # Pages without known geometry are capped after rendering
+        height, width = page.shape[:2]
+        if settings.max_pixels and height * width > settings.max_pixels:
+            scale = (settings.max_pixels / (height * width)) ** 0.5
+            page = cv2.resize(page, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        yield page
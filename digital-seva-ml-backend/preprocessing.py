@@ -0,0 +1,98 @@
+# preprocessing.py
+import logging
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+# Stages take and return a single-channel uint8 image
+
+def adaptive_threshold(image: np.ndarray, block_size: int = 11, c: int = 2) -> np.ndarray:
+    return cv2.adaptiveThreshold(
+        image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY, block_size, c
+    )
+
+
+def otsu_threshold(image: np.ndarray) -> np.ndarray:
+    _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return binary
+
+
+def sauvola_threshold(image: np.ndarray, window: int = 25, k: float = 0.2, r: float = 128.0) -> np.ndarray:
+    """Sauvola binarization from box-filtered local mean and standard deviation"""
+    image_f = image.astype(np.float32)
+    mean = cv2.boxFilter(image_f, -1, (window, window))
+    sq_mean = cv2.boxFilter(image_f * image_f, -1, (window, window))
+    std = np.sqrt(np.maximum(sq_mean - mean * mean, 0))
+    threshold = mean * (1 + k * (std / r - 1))
+    return np.where(image_f > threshold, 255, 0).astype(np.uint8)
+
+
+def nl_means_denoise(image: np.ndarray, h: float = 3) -> np.ndarray:
+    return cv2.fastNlMeansDenoising(image, None, h)
+
+
+def median_filter(image: np.ndarray, size: int = 3) -> np.ndarray:
+    return cv2.medianBlur(image, size)
+
+
+def bilateral_filter(image: np.ndarray, diameter: int = 5, sigma_color: float = 50,
+                     sigma_space: float = 50) -> np.ndarray:
+    return cv2.bilateralFilter(image, diameter, sigma_color, sigma_space)
+
+
+def morphological_opening(image: np.ndarray, size: int = 2) -> np.ndarray:
+    # Opens the dark ink layer (a closing on black-on-white pages) to drop isolated specks
+    kernel = np.ones((size, size), np.uint8)
+    return cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
+
+
+STAGES: Dict[str, Callable[..., np.ndarray]] = {
+    'adaptive_threshold': adaptive_threshold,
+    'otsu': otsu_threshold,
+    'sauvola': sauvola_threshold,
+    'nl_means': nl_means_denoise,
+    'median': median_filter,
+    'bilateral': bilateral_filter,
+    'opening': morphological_opening
+}
+
+# Named pipelines, ordered from most accurate/expensive to cheapest
+PIPELINES: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {
+    # The original preprocessing: NL-means on the adaptive-threshold output
+    'default': [
+        ('adaptive_threshold', {}),
+        ('nl_means', {})
+    ],
+    # Edge-preserving smoothing before a local threshold, specks removed after
+    'balanced': [
+        ('bilateral', {}),
+        ('sauvola', {}),
+        ('opening', {})
+    ],
+    # Cheapest: salt-and-pepper removal and a global threshold
+    'fast': [
+        ('median', {'size': 3}),
+        ('otsu', {})
+    ]
+}
+
+# Document classes that use a pipeline other than the default. Empty until a
+# type has before/after OCR accuracy numbers on real scans to justify its entry.
+DOCUMENT_PIPELINES: Dict[str, str] = {}
+
+
+def run_pipeline(image: np.ndarray, name: str, timings: Dict[str, float]) -> np.ndarray:
+    """Run a named pipeline on a grayscale image, adding each stage's time in ms to timings"""
+    for stage, params in PIPELINES[name]:
+        started = time.perf_counter()
+        image = STAGES[stage](image, **params)
+        elapsed = (time.perf_counter() - started) * 1000
+        timings[stage] = round(timings.get(stage, 0) + elapsed, 2)
+    return image
@@ -0,0 +1,171 @@
+# regex_audit.py
+"""Fuzz every validator and text-handling pattern for super-linear matching time.
+
+    python regex_audit.py [--owner 'PAN Card'] [--size 1000] [--max-exponent 1.4]
+
+Besides the registered validator patterns, the compiled patterns that the
+modules in TEXT_MODULES keep at module level (directly, or inside dicts,
+tuples and their own objects, such as the confusion normalizer's layouts)
+are audited under the module's name as owner. Each pattern is searched in inputs of size n, 2n and 4n built to
+make a backtracking engine work hard: repeats of the pattern's own literal
+words without the rest of a match, long runs of one character class, and
+OCR-like noise. A linear pattern takes about twice as long each time the
+input doubles; the tool reports patterns whose time grows faster and exits
+with status 1 if there are any, so it can gate a build.
+"""
+import argparse
+import importlib
+import logging
+import math
+import random
+import re
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from document_classifier import CHAR_CLASS, ESCAPE
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Modules whose own patterns run over OCR or text-layer text
+TEXT_MODULES = (
+    'identifier_extractor', 'ocr_normalizer', 'normalized_text', 'document_classifier', 'pdf_pages'
+)
+# How far into containers and objects module_patterns() looks
+MAX_DEPTH = 4
+
+WORD = re.compile(r'[A-Za-z]{2,}|[ऀ-ॿ]{2,}')
+# OCR-like noise: mostly letters and spaces, some digits and punctuation
+NOISE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' * 3 + '0123456789' + ' ' * 12 + ',./-:\n'
+# Searches shorter than this at the largest size are too fast to time reliably
+MIN_SECONDS = 0.002
+REPEATS = 3
+# Literal words of a pattern that each get an input family of their own
+MAX_SINGLE_WORDS = 6
+
+
+def _words(pattern: Pattern) -> List[str]:
+    source = ESCAPE.sub(' ', CHAR_CLASS.sub(' ', pattern.pattern))
+    words = WORD.findall(source)
+    return [word.upper() for word in words] if pattern.flags & re.IGNORECASE else words
+
+
+def _repeat(unit: str, size: int) -> str:
+    return (unit * (size // max(len(unit), 1) + 1))[:size]
+
+
+def inputs(pattern: Pattern) -> Dict[str, Callable[[int], str]]:
+    """Input families, each a function from size to text"""
+    words = _words(pattern)
+    families = {
+        'letters': lambda size: _repeat('A', size),
+        'letters and spaces': lambda size: _repeat('AB ', size),
+        'digits and commas': lambda size: _repeat('1,', size),
+        'address': lambda size: _repeat('A1, /-', size),
+        'noise': lambda size: ''.join(random.Random(size).choice(NOISE_CHARS) for _ in range(size))
+    }
+    if words:
+        # Each literal word followed by matchable filler, so every start gets far before failing
+        unit = ' '.join(f"{word} 12,345 AB" for word in dict.fromkeys(words)) + ' '
+        families['own words'] = lambda size: _repeat(unit, size)
+        families['own words, no spaces'] = lambda size: _repeat(unit.replace(' ', ''), size)
+    for word in list(dict.fromkeys(words))[:MAX_SINGLE_WORDS]:
+        # One literal word over and over: many starts, none of which can finish
+        families[f'only {word}'] = lambda size, word=word: _repeat(f"{word} AB CD ", size)
+    return families
+
+
+def _find_patterns(name: str, value: Any, depth: int = 0) -> Iterator[Tuple[str, Pattern]]:
+    if isinstance(value, re.Pattern):
+        if isinstance(value.pattern, str):
+            yield name, value
+    elif depth == MAX_DEPTH:
+        return
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _find_patterns(f"{name}[{key}]", item, depth + 1)
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            yield from _find_patterns(f"{name}[{index}]", item, depth + 1)
+    elif type(value).__module__ in TEXT_MODULES:
+        # Instances of the project's own classes, e.g. normalized_text.ID_CONFUSIONS
+        for attr, item in vars(value).items():
+            yield from _find_patterns(f"{name}.{attr}", item, depth + 1)
+
+
+def module_patterns(module: ModuleType) -> Iterator[Tuple[str, Pattern]]:
+    """(name, compiled pattern) for every str pattern a module holds at module level"""
+    seen = set()
+    for name, value in vars(module).items():
+        if name.startswith('__') or isinstance(value, ModuleType):
+            continue
+        for found, pattern in _find_patterns(name, value):
+            if id(pattern) not in seen:
+                seen.add(id(pattern))
+                yield found, pattern
+
+
+def patterns(owner: Optional[str] = None) -> List[Tuple[str, str, Pattern]]:
+    """(owner, name, compiled pattern) for the registered patterns and those of TEXT_MODULES"""
+    # Imported here so that logging is set up first: document_validators calls basicConfig on import
+    from document_validators import PATTERNS
+
+    found = list(PATTERNS.items(owner))
+    for module_name in TEXT_MODULES:
+        if owner is None or owner == module_name:
+            module = importlib.import_module(module_name)
+            found.extend((module_name, name, pattern) for name, pattern in module_patterns(module))
+    return found
+
+
+def _time(pattern: Pattern, text: str) -> float:
+    best = math.inf
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in pattern.finditer(text):
+            pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def audit(pattern: Pattern, size: int) -> Tuple[float, str, List[float]]:
+    """Worst growth exponent over the input families, with the family and its times"""
+    worst = (0.0, '', [])
+    for family, make in inputs(pattern).items():
+        times = [_time(pattern, make(size * factor)) for factor in (1, 2, 4)]
+        if times[-1] < MIN_SECONDS:
+            continue
+        exponent = math.log2(times[2] / max(times[1], 1e-9))
+        if exponent > worst[0]:
+            worst = (exponent, family, times)
+    return worst
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--owner', help="Only audit this document type's patterns")
+    parser.add_argument('--size', type=int, default=1000, help="Smallest input length")
+    parser.add_argument('--max-exponent', type=float, default=1.4,
+                        help="Flag patterns whose time grows faster than size ** this")
+    args = parser.parse_args(argv)
+
+    flagged = 0
+    audited = patterns(args.owner)
+    for owner, name, pattern in audited:
+        exponent, family, times = audit(pattern, args.size)
+        if exponent > args.max_exponent:
+            flagged += 1
+            print(f"{owner}/{name}: grows like n^{exponent:.1f} on {family} "
+                  f"({', '.join(f'{t * 1000:.1f}ms' for t in times)})")
+            print(f"    {pattern.pattern.strip()}")
+    print(f"{flagged} of {len(audited)} patterns grow super-linearly")
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    # Configured before any validator module is imported, so their DEBUG basicConfig is a no-op
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.INFO)
+    sys.exit(main())
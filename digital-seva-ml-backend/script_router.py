@@ -0,0 +1,62 @@
+# script_router.py
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from ocr_engines import ScriptInfo
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Minimal language set per detected script. Indian documents in a regional
+# script nearly always carry English as well, so English stays in every set.
+SCRIPT_LANGUAGES = {
+    'Latin': 'eng',
+    'Devanagari': 'eng+hin',
+    'Bengali': 'eng+ben',
+    'Tamil': 'eng+tam',
+    'Telugu': 'eng+tel',
+    'Kannada': 'eng+kan',
+    'Malayalam': 'eng+mal',
+    'Gujarati': 'eng+guj',
+    'Gurmukhi': 'eng+pan',
+    'Oriya': 'eng+ori'
+}
+
+ROTATIONS = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE
+}
+
+
+def _installed(engine, lang: str) -> str:
+    """Drop language packs that are not installed, keeping at least English"""
+    available = engine.available_languages()
+    installed = [code for code in lang.split('+') if code in available]
+    return '+'.join(installed) or 'eng'
+
+
+def route_page(engine, gray: np.ndarray, default_lang: str,
+               min_script_conf: float = 1.0) -> Tuple[np.ndarray, str, Optional[ScriptInfo]]:
+    """Detect a page's script and orientation, returning the upright page and its languages.
+
+    Falls back to default_lang when detection fails or is not confident enough.
+    """
+    info = engine.detect_script(gray)
+    if info is None or info.script_conf < min_script_conf or info.script not in SCRIPT_LANGUAGES:
+        logger.info(f"Script routing: no confident script ({info}); using '{default_lang}'")
+        return gray, default_lang, info
+
+    if info.rotate in ROTATIONS:
+        gray = cv2.rotate(gray, ROTATIONS[info.rotate])
+
+    lang = _installed(engine, SCRIPT_LANGUAGES[info.script])
+    skipped = set(default_lang.split('+')) - set(lang.split('+'))
+    logger.info(
+        f"Script routing: {info.script} (conf {info.script_conf:.1f}) -> '{lang}'"
+        f"{f', skipped models: {sorted(skipped)}' if skipped else ''}"
+    )
+    return gray, lang, info
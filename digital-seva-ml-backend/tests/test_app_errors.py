@@ -0,0 +1,41 @@
+# test_app_errors.py
+import io
+import os
+import tempfile
+
+import pytest
+
+# Keep the job database and OCR cache out of the working tree
+os.environ.setdefault('JOB_DB_PATH', os.path.join(tempfile.mkdtemp(), 'jobs.sqlite3'))
+os.environ.setdefault('OCR_CACHE_DIR', tempfile.mkdtemp())
+
+import app  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def _fail(*args, **kwargs):
+    raise OSError("upload could not be read")
+
+
+def test_batch_errors_are_json(client, monkeypatch):
+    monkeypatch.setattr(app, 'open_upload', _fail)
+    response = client.post('/verify/batch', data={
+        'files': [(io.BytesIO(b'%PDF-1.4'), 'a.pdf')],
+        'documentTypes': ['PAN Card']
+    })
+    assert response.status_code == 500
+    assert response.json == {"error": "upload could not be read"}
+
+
+def test_job_creation_errors_are_json(client, monkeypatch):
+    monkeypatch.setattr(app.job_queue, 'submit', _fail)
+    response = client.post('/verify/jobs', data={
+        'file': (io.BytesIO(b'%PDF-1.4'), 'a.pdf'),
+        'documentType': 'PAN Card'
+    })
+    assert response.status_code == 500
+    assert response.json == {"error": "upload could not be read"}
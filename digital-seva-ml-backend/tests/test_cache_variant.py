@@ -0,0 +1,47 @@
+# test_cache_variant.py
+import os
+import tempfile
+
+import pytest
+
+# Keep the job database and OCR cache out of the working tree
+os.environ.setdefault('JOB_DB_PATH', os.path.join(tempfile.mkdtemp(), 'jobs.sqlite3'))
+os.environ.setdefault('OCR_CACHE_DIR', tempfile.mkdtemp())
+
+import app  # noqa: E402
+from ocr_pipeline import OCROptions  # noqa: E402
+from pdf_pages import RenderSettings  # noqa: E402
+from uploads import UploadedPDF  # noqa: E402
+
+
+@pytest.mark.parametrize('changes', [
+    {'mode': 'dual'}, {'min_confidence': 70.0}, {'min_words': 5}, {'text_layer': False},
+    {'pipeline': 'fast'}, {'text_regions': True}, {'script_routing': True},
+])
+def test_every_ocr_option_changes_the_variant(changes):
+    assert OCROptions(**changes).cache_variant() != OCROptions().cache_variant()
+
+
+@pytest.mark.parametrize('changes', [
+    {'dpi': 300}, {'target_text_height': 40}, {'min_page_height': 1200},
+    {'min_dpi': 100}, {'max_dpi': 300}, {'max_pixels': 10_000_000},
+])
+def test_every_render_setting_changes_the_variant(changes):
+    assert RenderSettings(**changes).cache_variant() != RenderSettings().cache_variant()
+
+
+def test_cache_key_includes_server_settings(monkeypatch):
+    keys = []
+    monkeypatch.setattr(app.ocr_cache, 'key', lambda digest, *variant: keys.append(variant) or 'key')
+    monkeypatch.setattr(app.ocr_cache, 'get', lambda key: 'cached text')
+
+    with UploadedPDF.from_bytes(b'%PDF-1.4') as upload:
+        app.extract_upload_text(upload, 'a.pdf', 'PAN Card', OCROptions())
+
+    variant = keys[0]
+    assert variant[:len(OCROptions().cache_variant())] == OCROptions().cache_variant()
+    for part in app.render_settings.cache_variant() + (
+        f"max_pages={app.app.config['MAX_PDF_PAGES']}",
+        f"text_layer_min_chars={app.app.config['TEXT_LAYER_MIN_CHARS']}",
+    ):
+        assert part in variant
@@ -0,0 +1,94 @@
+# test_identifier_extractor.py
+import pytest
+
+from identifier_extractor import (AADHAAR, ACCOUNT, DRIVING_LICENSE, EPIC, IFSC, PAN, PIN,
+                                  extract_identifiers, verhoeff_valid)
+from normalized_text import NormalizedText
+
+# A number with a correct Verhoeff check digit
+AADHAAR_NUMBER = '234567890124'
+
+
+def found(text, kind):
+    return [(identifier.value, identifier.text) for identifier in extract_identifiers(text).of(kind)]
+
+
+def test_verhoeff_accepts_valid_number():
+    assert verhoeff_valid(AADHAAR_NUMBER)
+
+
+@pytest.mark.parametrize('position', range(len(AADHAAR_NUMBER)))
+def test_verhoeff_rejects_any_single_digit_change(position):
+    for digit in '0123456789':
+        if digit != AADHAAR_NUMBER[position]:
+            changed = AADHAAR_NUMBER[:position] + digit + AADHAAR_NUMBER[position + 1:]
+            assert not verhoeff_valid(changed), changed
+
+
+def test_aadhaar_needs_check_digit():
+    assert found("AADHAAR NO 2345 6789 0124 DOB", AADHAAR) == [(AADHAAR_NUMBER, '2345 6789 0124')]
+    assert found("AADHAAR NO 2345 6789 0125 DOB", AADHAAR) == []
+
+
+def test_aadhaar_split_over_spaces_and_newlines():
+    assert found("AADHAAR\n2345\n6789 0124\nMALE", AADHAAR) == [(AADHAAR_NUMBER, '2345\n6789 0124')]
+
+
+def test_aadhaar_digits_are_not_taken_again_as_pin():
+    assert found("2345 6789 0124", PIN) == []
+
+
+@pytest.mark.parametrize('printed', [
+    'MH-12-2011-0012345',
+    'MH12 20110012345',
+    'MH/12/2011/0012345',
+    'MH-12/2011/0012345',
+])
+def test_driving_license_kept_as_printed(printed):
+    assert found(f"DL NO: {printed} VALID TILL", DRIVING_LICENSE) == [('MH1220110012345', printed)]
+
+
+def test_driving_license_year_must_be_plausible():
+    table = extract_identifiers("DL NO: MH12 99110012345")
+    assert [identifier.exact for identifier in table.of(DRIVING_LICENSE)] == [False]
+
+
+def test_pan_also_looks_like_ocr_epic():
+    table = extract_identifiers("PERMANENT ACCOUNT NUMBER ABCPE1234F")
+    assert [(pan.value, pan.exact) for pan in table.of(PAN)] == [('ABCPE1234F', True)]
+    assert [(epic.value, epic.exact) for epic in table.of(EPIC)] == [('ABCPE1234F', False)]
+
+
+def test_epic_is_not_a_pan():
+    table = extract_identifiers("EPIC NO: ABC1234567")
+    assert table.of(PAN) == []
+    assert table.best(EPIC).value == 'ABC1234567'
+    assert table.best(EPIC).labelled
+
+
+def test_labelled_epic_preferred_over_earlier_lookalike():
+    table = extract_identifiers("ABCPE1234F ELECTOR CARD EPIC NO: XYZ7654321")
+    assert table.best(EPIC).value == 'XYZ7654321'
+
+
+def test_old_epic_with_slashes():
+    assert found("AB/12/345/678901", EPIC) == [('AB12345678901', 'AB/12/345/678901')]
+
+
+def test_pan_glued_to_next_word():
+    assert found("PAN ABCPE1234FRAHUL", PAN) == [('ABCPE1234F', 'ABCPE1234F')]
+
+
+def test_ifsc_fifth_character_must_be_zero():
+    assert found("IFSC CODE: SBIN0001234", IFSC) == [('SBIN0001234', 'SBIN0001234')]
+    assert found("IFSC CODE: SBINO001234", IFSC) == []
+
+
+def test_ifsc_with_letter_o_is_read_after_confusions_are_undone():
+    identifiers = NormalizedText("IFSC Code: SBINO001234").identifiers
+    assert [(ifsc.value, ifsc.labelled) for ifsc in identifiers.of(IFSC)] == [('SBIN0001234', True)]
+
+
+def test_grouped_account_number_needs_label():
+    assert found("A/C NO: 1234 5678 9012 3", ACCOUNT) == [('1234567890123', '1234 5678 9012 3')]
+    assert found("PHONE 98765 43210 12", ACCOUNT) == []
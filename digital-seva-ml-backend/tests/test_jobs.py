@@ -0,0 +1,60 @@
+# test_jobs.py
+import sqlite3
+import time
+
+from jobs import DONE, FAILED, QUEUED, RUNNING, JobQueue, JobStore
+
+
+def _age(store, job_id, seconds):
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute('UPDATE jobs SET updated_at = updated_at - ? WHERE id = ?', (seconds, job_id))
+
+
+def _statuses(store, job_ids):
+    return [store.get(job_id).status if store.get(job_id) else None for job_id in job_ids]
+
+
+def test_purge_deletes_only_old_finished_jobs(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    done, failed, recent, queued, running = (store.create('PAN Card', 'a.pdf', {}, b'%PDF') for _ in range(5))
+    store.finish(done.id, result={'isValid': True})
+    store.finish(failed.id, error='broken')
+    store.finish(recent.id, result={'isValid': False})
+    store.claim(running.id)
+    for job in (done, failed, queued, running):
+        _age(store, job.id, 3600)
+
+    assert store.purge(time.time() - 60) == 2
+    assert _statuses(store, [done.id, failed.id, recent.id, queued.id, running.id]) == [
+        None, None, DONE, QUEUED, RUNNING
+    ]
+
+
+def test_workers_purge_expired_jobs(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    old = store.create('PAN Card', 'a.pdf', {}, b'%PDF')
+    store.finish(old.id, error='broken')
+    _age(store, old.id, 3600)
+
+    job_queue = JobQueue(store, lambda job, progress: {'isValid': True},
+                         workers=1, retention=60, purge_interval=0.05)
+    job = job_queue.submit('PAN Card', 'b.pdf', {}, b'%PDF')
+    finished = job_queue.wait(job.id, 5)
+
+    assert finished.status == DONE
+    deadline = time.monotonic() + 5
+    while store.get(old.id) is not None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert store.get(old.id) is None
+    assert store.get(job.id).status == DONE
+
+
+def test_no_retention_keeps_jobs(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    old = store.create('PAN Card', 'a.pdf', {}, b'%PDF')
+    store.finish(old.id, error='broken')
+    _age(store, old.id, 10 ** 8)
+
+    job_queue = JobQueue(store, lambda job, progress: {}, workers=1)
+    job_queue.wait(job_queue.submit('PAN Card', 'b.pdf', {}, b'%PDF').id, 5)
+    assert store.get(old.id).status == FAILED
@@ -0,0 +1,43 @@
+# test_marker_scanner.py
+import re
+
+import pytest
+
+from document_validators import DOCUMENT_VALIDATORS
+from marker_scanner import MarkerScanner, _literal_prefixes
+
+
+@pytest.mark.parametrize('source, prefixes', [
+    (r'ELECTION\s*COMMISSION', ['ELECTION']),
+    (r'RATION\s*CARD|राशन\s*कार्ड', ['RATION', 'राशन']),
+    (r'(?:FOO)BAR|BAZ', ['FOO', 'BAZ']),
+    (r'(?:INCOME|आय)\s*CERTIFICATE', ['INCOME', 'आय']),
+    (r'\bPAN\b|\d{4}', None),
+    (r'(?:FOO)?BAR', None),
+    (r'(?:A|BC)D', None),
+])
+def test_literal_prefixes(source, prefixes):
+    assert _literal_prefixes(source) == prefixes
+
+
+@pytest.mark.parametrize('text', [
+    "राशन कार्ड खाद्य विभाग",
+    "RATION CARD FOOD DEPARTMENT",
+    "(?:FOO)BAR BAZ",
+    "NOTHING TO SEE",
+])
+def test_scan_matches_plain_search(text):
+    patterns = [re.compile(r'RATION\s*CARD|राशन\s*कार्ड'), re.compile(r'(?:FOO)BAR|BAZ')]
+    scan = MarkerScanner({'markers': patterns}).scan(text)
+    assert scan.found('markers') == [pattern for pattern in patterns if pattern.search(text)]
+
+
+def test_validator_markers_match_plain_search():
+    text = "राशन कार्ड आयकर विभाग ELECTION COMMISSION OF INDIA GOVT OF INDIA"
+    for validator in DOCUMENT_VALIDATORS.values():
+        scanner = getattr(validator, 'marker_scanner', None)
+        if not isinstance(scanner, MarkerScanner):
+            continue
+        scan = scanner.scan(text)
+        for group, patterns in scanner.groups.items():
+            assert scan.found(group) == [pattern for pattern in patterns if pattern.search(text)]
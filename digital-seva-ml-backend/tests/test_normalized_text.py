@@ -0,0 +1,115 @@
+# test_normalized_text.py
+import dataclasses
+
+import pytest
+
+import normalized_text
+from document_validators import DOCUMENT_VALIDATORS
+from identifier_extractor import AADHAAR, ACCOUNT, DRIVING_LICENSE, EPIC, IFSC, PAN, PIN
+from normalized_text import DEVANAGARI, LATIN, NormalizedText
+
+SAMPLES = {
+    'aadhaar': "Government of India Unique Identification Authority of India Rahul Kumar DOB: 12/05/1990 "
+               "Male 2345 6789 0124 भारत सरकार",
+    'pan': "income tax department abcpe1234f name rahul kumar father's name suresh kumar "
+           "dob: 01-02-1985 AB0PE12S4F",
+    'voter': "ELECTION COMMISSION OF INDIA ELECTOR PHOTO IDENTITY CARD EPIC NO: ABC1234567 "
+             "Elector's Name: RAHUL KUMAR Father's Name: SURESH Sex: MALE Date of Birth: 12/05/1990 Address",
+    'licence': "INDIAN UNION DRIVING LICENCE Issued by Transport Department MAHARASHTRA MH12 20110012345 "
+               "Name RAHUL DOB 12-05-1990 Address MUMBAI Signature Thumb impression Valid Throughout India",
+    'ration': "RATION CARD Food and Civil Supplies Department Card No: MH/1234567 BPL "
+              "Address: 12 MG ROAD PUNE DISTRICT: PUNE Units Alloted: 4 Income of family: Rs. 45000 "
+              "Date of Issue: 01/02/2015",
+    'income': "Revenue Department Delhi INCOME CERTIFICATE Certificate No: 123456 This is to certify that "
+              "the annual income of the family is Rs. 2,50,000 per annum Tehsildar Date: 12/03/2021",
+    'birth': "BIRTH CERTIFICATE Registration of Birth Municipal Corporation of Delhi Registration No: "
+             "0122-0701150862 Name: RAHUL KUMAR Gender: MALE Date of Birth: 12/05/2010 "
+             "Place of Birth: CITY HOSPITAL DELHI Date of Registration: 15/05/2010",
+    'bank': "STATE BANK OF INDIA PASSBOOK A/C No: 12345678901 IFSC Code: SBIN0001234 Name: RAHUL KUMAR "
+            "Branch: MG ROAD PUNE IFSC Address: 12 MG ROAD PUNE PIN Code: 411001 Account Type: SAVINGS",
+    'employment': "CERTIFICATE OF EMPLOYMENT This is to certify that RAHUL KUMAR has been employed as "
+                  "SENIOR ENGINEER from JANUARY 2015 with ACME PVT LTD",
+    'empty': "",
+}
+
+
+def test_is_frozen():
+    text = NormalizedText("abc")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        text.raw = "xyz"
+
+
+def test_of_reuses_an_existing_instance():
+    text = NormalizedText("abc")
+    assert NormalizedText.of(text) is text
+    assert NormalizedText.of(None).raw == ""
+
+
+@pytest.mark.parametrize('form', ['upper', 'stripped', 'tokens', 'segments', 'identifiers'])
+def test_each_form_is_computed_once(form):
+    text = NormalizedText(SAMPLES['aadhaar'])
+    first = getattr(text, form)
+    assert getattr(text, form) is first
+    assert vars(text)[form] is first
+
+
+def test_identifiers_are_extracted_once(monkeypatch):
+    calls = []
+    extract = normalized_text.extract_identifiers
+    monkeypatch.setattr(normalized_text, 'extract_identifiers',
+                        lambda text: calls.append(text) or extract(text))
+    text = NormalizedText(SAMPLES['bank'])
+    for validator in DOCUMENT_VALIDATORS.values():
+        validator.validate(text)
+    assert len(calls) == 1
+
+
+def test_forms():
+    text = NormalizedText("Name: Rahul, भारत सरकार  PAN-1")
+    assert text.upper == "NAME: RAHUL, भारत सरकार  PAN-1"
+    assert NormalizedText("Name: Rahul,  PAN-1").stripped == "NAME RAHUL PAN 1"
+    assert [token.text for token in text.tokens] == ['NAME', 'RAHUL', 'भारत', 'सरकार', 'PAN', '1']
+    assert [(segment.script, text.upper[segment.start:segment.end]) for segment in text.segments] == [
+        (LATIN, 'NAME: RAHUL'), (DEVANAGARI, 'भारत सरकार'), (LATIN, 'PAN-1')
+    ]
+
+
+@pytest.mark.parametrize('sample, kind, values', [
+    ('aadhaar', AADHAAR, ['234567890124']),
+    # The second PAN is read back from its OCR'd form, AB0PE12S4F
+    ('pan', PAN, ['ABCPE1234F', 'ABOPE1254F']),
+    ('voter', EPIC, ['ABC1234567']),
+    ('licence', DRIVING_LICENSE, ['MH1220110012345']),
+    ('bank', ACCOUNT, ['12345678901']),
+    ('bank', IFSC, ['SBIN0001234']),
+    ('bank', PIN, ['411001']),
+    ('empty', PAN, []),
+])
+def test_identifiers(sample, kind, values):
+    assert [identifier.value for identifier in NormalizedText(SAMPLES[sample]).identifiers.of(kind)] == values
+
+
+@pytest.mark.parametrize('sample', SAMPLES)
+def test_validators_give_same_result_for_str_and_normalized_text(sample):
+    # One instance shared by every validator, as a request does
+    text = NormalizedText(SAMPLES[sample])
+    for name, validator in DOCUMENT_VALIDATORS.items():
+        assert validator.validate(text) == validator.validate(SAMPLES[sample]), name
+
+
+def test_pan_preprocess_keeps_text_as_read():
+    validator = DOCUMENT_VALIDATORS['PAN Card']
+    # OCR confusions in the PAN are undone in the identifiers, not in the text names are read from
+    for text in ("name rahul pan abcpei234f", NormalizedText("name rahul pan abcpei234f")):
+        assert validator.preprocess_text(text) == "NAME RAHUL PAN ABCPEI234F"
+
+
+def test_pan_number_still_read_through_identifiers():
+    result = DOCUMENT_VALIDATORS['PAN Card'].validate(
+        "INCOME TAX DEPARTMENT PERMANENT ACCOUNT NUMBER ABCPEI234F NAME: RAHUL KUMAR "
+        "FATHER'S NAME: SURESH KUMAR DATE OF BIRTH 12/05/1990"
+    )
+    assert result['isValid']
+    assert result['extractedData'] == {
+        'pan_number': 'ABCPE1234F', 'name': 'RAHUL KUMAR', 'date_of_birth': '12/05/1990'
+    }
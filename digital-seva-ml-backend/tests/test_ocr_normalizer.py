@@ -0,0 +1,67 @@
+# test_ocr_normalizer.py
+import pytest
+
+from identifier_extractor import PAN
+from normalized_text import ID_CONFUSIONS
+from ocr_normalizer import ConfusionNormalizer
+
+PAN_CONFUSIONS = ConfusionNormalizer([PAN])
+
+
+@pytest.mark.parametrize('normalizer', [PAN_CONFUSIONS, ID_CONFUSIONS], ids=['pan', 'all ids'])
+@pytest.mark.parametrize('read, printed', [
+    ('ABCPEI234F', 'ABCPE1234F'),
+    ('A8CPE1234F', 'ABCPE1234F'),
+    ('ABCPEIZ34F', 'ABCPE1234F'),
+])
+def test_pan_confusions_undone_by_slot(normalizer, read, printed):
+    assert normalizer.normalize(f"PAN {read} DOB") == f"PAN {printed} DOB"
+
+
+@pytest.mark.parametrize('run', [
+    'ABCPE1234F',      # PAN: letters in letter slots, digits in digit slots
+    'ABC1234567',      # EPIC
+    'SBIN0001234',     # IFSC
+    'SBIN0OO1234',     # IFSC branch code slots take letters or digits
+    'MH1220110012345'  # DL
+])
+def test_identifiers_as_printed_are_left_alone(run):
+    assert ID_CONFUSIONS.normalize(run) == run
+
+
+def test_only_the_other_kind_is_swapped_in_each_slot():
+    # S in a letter slot stays a letter; O and I in digit slots become digits
+    assert PAN_CONFUSIONS.normalize('ASCPEOI23F') == 'ASCPE0123F'
+
+
+def test_ifsc_reserved_zero():
+    assert ID_CONFUSIONS.normalize('IFSC SBINO001234') == 'IFSC SBIN0001234'
+
+
+@pytest.mark.parametrize('run', [
+    'ABCP1234F',    # too short for a PAN
+    'AB12CD34EF',   # D in a digit slot is not a confusion
+    '2O11001234',   # mostly digits where letters belong: a number, not a PAN
+    'ABCPE1234FG',  # PAN glued to a letter
+])
+def test_runs_that_do_not_fit_a_layout_are_unchanged(run):
+    assert ID_CONFUSIONS.normalize(run) == run
+
+
+@pytest.mark.parametrize('text', [
+    'PERMANENT ACCOUNT NUMBER',
+    'INCOME TAX DEPARTMENT GOVT OF INDIA',
+    'BIRTHPLACE SIGNATURE',
+    'ELECTION COMMISSION OF INDIA IDENTITY CARD',
+])
+def test_plain_words_are_never_changed(text):
+    assert PAN_CONFUSIONS.normalize(text) == text
+    assert ID_CONFUSIONS.normalize(text) == text
+
+
+def test_positions_are_kept():
+    text = "NAME RAHUL PAN ABCPEI234F DL MH12Z011OO12345 END"
+    normalized = ID_CONFUSIONS.normalize(text)
+    assert len(normalized) == len(text)
+    assert normalized.index('ABCPE1234F') == text.index('ABCPEI234F')
+    assert 'MH1220110012345' in normalized
@@ -0,0 +1,91 @@
+# test_ocr_timeout.py
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import ocr_engines
+import ocr_pipeline
+from ocr_engines import OCRTimeoutError, TesserocrEngine
+from ocr_pipeline import OCROptions, PageOCRPool
+
+
+class RecordingEngine:
+    """Stands in for the OCR engine and records the timeout of every call"""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def image_to_data(self, image, lang, config='', timeout=0):
+        self.timeouts.append(timeout)
+        return "PERMANENT ACCOUNT NUMBER", [('PERMANENT', 95.0), ('ACCOUNT', 95.0), ('NUMBER', 95.0)]
+
+
+class FakeAPI:
+    """The parts of tesserocr.PyTessBaseAPI the engine calls"""
+
+    def __init__(self, finishes: bool):
+        self.finishes = finishes
+        self.recognize_calls = []
+        self.read = False
+
+    def SetPageSegMode(self, mode):
+        pass
+
+    def SetImageBytes(self, *args):
+        pass
+
+    def Recognize(self, timeout=0):
+        self.recognize_calls.append(timeout)
+        return self.finishes
+
+    def GetUTF8Text(self):
+        self.read = True
+        return "TEXT"
+
+    def MapWordConfidences(self):
+        return [('TEXT', 90)]
+
+    def Clear(self):
+        pass
+
+
+def test_serial_pool_passes_page_timeout_to_engine(monkeypatch):
+    engine = RecordingEngine()
+    monkeypatch.setattr(ocr_pipeline, 'get_engine', lambda: engine)
+    page = np.full((100, 200), 255, np.uint8)
+    pool = PageOCRPool(max_workers=1, page_timeout=7.5)
+
+    results = list(pool.imap_pages([page, page], OCROptions(pipeline='fast', min_words=1)))
+
+    assert len(results) == 2
+    assert engine.timeouts == [7.5, 7.5]
+
+
+@pytest.fixture
+def tesserocr_engine(monkeypatch):
+    # Only the PSM constant is read from the module outside the API object
+    monkeypatch.setattr(ocr_engines, 'tesserocr', SimpleNamespace(PSM=SimpleNamespace(AUTO=3)))
+    return TesserocrEngine()
+
+
+def test_tesserocr_engine_enforces_timeout(tesserocr_engine, monkeypatch):
+    api = FakeAPI(finishes=False)
+    monkeypatch.setattr(tesserocr_engine, '_create_api', lambda lang: api)
+    image = np.zeros((10, 10), np.uint8)
+
+    with pytest.raises(OCRTimeoutError):
+        tesserocr_engine.image_to_data(image, 'eng', timeout=2.5)
+    assert api.recognize_calls == [2500]
+    assert not api.read
+
+
+def test_tesserocr_engine_reads_text_after_recognition(tesserocr_engine, monkeypatch):
+    api = FakeAPI(finishes=True)
+    monkeypatch.setattr(tesserocr_engine, '_create_api', lambda lang: api)
+    image = np.zeros((10, 10), np.uint8)
+
+    assert tesserocr_engine.image_to_data(image, 'eng', timeout=2.5) == ("TEXT", [('TEXT', 90.0)])
+    assert tesserocr_engine.image_to_string(image, 'eng') == "TEXT"
+    # No timeout: recognition is left to GetUTF8Text
+    assert api.recognize_calls == [2500]
@@ -0,0 +1,181 @@
+# test_pattern_rewrites.py
+"""Patterns bounded for linear matching time still match what they used to.
+
+Each case is a registered pattern, its source before the rewrite and a text
+it should read; the rewritten pattern must find the same span and groups.
+"""
+import re
+
+import pytest
+
+from document_validators import DOCUMENT_VALIDATORS, PATTERNS
+
+REWRITES = [
+    ('PAN Card', 'name[0]',
+     r'NAME[:\s]+([A-Z][A-Z\s]+?)(?=\s+(?:FATHER|DATE|DOB|SIGN|$))',
+     "INCOME TAX DEPARTMENT NAME: RAHUL KUMAR FATHER'S NAME: SURESH KUMAR"),
+    ('PAN Card', 'name[1]',
+     r'नाम[:\s]+([A-Z][A-Z\s]+?)(?=\s+(?:FATHER|DATE|DOB|SIGN|$))',
+     "आयकर विभाग नाम: RAHUL KUMAR DATE OF BIRTH 12/05/1990"),
+    ('PAN Card', 'father[0]',
+     r"FATHER(?:'S)?\s*NAME[:\s]+([A-Z][A-Z\s]+?)(?=\s+(?:DATE|DOB|SIGN|$))",
+     "NAME: RAHUL KUMAR FATHER'S NAME: SURESH KUMAR DATE OF BIRTH 12/05/1990"),
+    ('PAN Card', 'father[1]',
+     r'पिता(?:\s*का)?\s*नाम[:\s]+([A-Z][A-Z\s]+?)(?=\s+(?:DATE|DOB|SIGN|$))',
+     "पिता का नाम: SURESH KUMAR DOB 12/05/1990"),
+    ('Income Certificate', 'Certificate Title',
+     r"""
+            (?:
+                INCOME\s+CERTIFICATE|
+                REVENUE\s+DEPARTMENT.*DELHI|
+                आय\s+प्रमाण\s+पत्र
+            )
+        """,
+     "GOVERNMENT OF NCT REVENUE DEPARTMENT, GOVT OF NCT OF DELHI"),
+    ('Income Certificate', 'Income Amount',
+     r"""
+            (?:
+                INCOME.*RS\.?\s*[\d,]+|
+                RS\.?\s*[\d,]+.*(?:PER\s+ANNUM|YEARLY|ANNUAL)
+            )
+        """,
+     "THE ANNUAL INCOME OF THE FAMILY FROM ALL SOURCES IS RS. 1,20,000"),
+    ('Disability Certificate', 'percent',
+     r'(\d{1,3})\s*%.*?(?:PERMANENT\s*)?DISABILITY',
+     "HE HAS 45 % PERMANENT DISABILITY IN RELATION TO HIS LOWER LIMBS"),
+    ('Disability Certificate', 'name',
+     r'EXAMINED\s+(?:SHRI|SMT|KUM)\.?\s+([A-Z\s]+?)(?:,|\s+(?:SON|DAUGHTER|WIFE))',
+     "CERTIFIED THAT WE HAVE CAREFULLY EXAMINED SHRI RAMESH SINGH SON OF MOHAN SINGH"),
+    ('Disability Certificate', 'address',
+     r'RESIDENT\s+OF\s+([A-Z0-9\s,/-]+?)(?=\s+(?:WHOSE|PHOTO|DATE|DISTRICT|STATE))',
+     "RESIDENT OF HOUSE NO 12, GANDHI NAGAR WHOSE PHOTOGRAPH IS AFFIXED"),
+    ('Birth Certificate', 'registration_numbers[2]',
+     r'[A-Z]+/\d+/\d+/\d+',
+     "REGISTRATION OF BIRTH BR/2019/123/456 DATE OF BIRTH: 12/03/2019"),
+    ('Birth Certificate', 'name',
+     r'NAME\s*[:.]\s*([A-Z\s]+?)(?=\s+(?:GENDER|SEX|DATE|FATHER|MOTHER))',
+     "NAME: RAVI KUMAR GENDER: MALE"),
+    ('Birth Certificate', 'place',
+     r'PLACE\s*OF\s*BIRTH\s*[:.]\s*([A-Z0-9\s,/-]+?)(?=\s+(?:DATE|MOTHER|FATHER|ADDRESS))',
+     "PLACE OF BIRTH: CITY HOSPITAL, DELHI DATE OF REGISTRATION: 15/03/2019"),
+    ('Birth Certificate', 'father',
+     r"FATHER['S]*\s*NAME\s*[:.]\s*([A-Z\s]+?)(?=\s+(?:MOTHER|ADDRESS|DATE))",
+     "FATHER'S NAME: SURESH KUMAR MOTHER'S NAME: SITA DEVI"),
+    ('Birth Certificate', 'mother',
+     r"MOTHER['S]*\s*NAME\s*[:.]\s*([A-Z\s]+?)(?=\s+(?:FATHER|ADDRESS|DATE))",
+     "MOTHER'S NAME: SITA DEVI ADDRESS: 12 MG ROAD DELHI"),
+    ('Birth Certificate', 'address',
+     r'(?:PRESENT\s*)?ADDRESS\s*[:.]\s*([A-Z0-9\s,/-]+?)(?=\s+(?:DATE|PERMANENT|NOTE|ENSURE))',
+     "PRESENT ADDRESS: 12 MG ROAD, DELHI-110001 DATE OF ISSUE: 20/03/2019"),
+    ('Marriage Certificate', 'husband[0]',
+     r"(?:HUSBAND|GROOM)[\'S]*\s*(?:NAME)?[:\s]+(?:MR\.?\s*)?([A-Z\s]+?)(?=\s+(?:RESIDING|AGE|DATE|WIFE|ADDRESS))",
+     "HUSBAND'S NAME: MR. RAJESH SHARMA AGE: 30 YEARS"),
+    ('Marriage Certificate', 'husband[1]',
+     r'NAME\s*OF\s*HUSBAND\s*(?:MR\.?\s*)?([A-Z\s]+?)(?=\s+(?:RESIDING|AGE|DATE|WIFE|ADDRESS))',
+     "NAME OF HUSBAND MR RAJESH SHARMA RESIDING AT PUNE"),
+    ('Marriage Certificate', 'wife[0]',
+     r"(?:WIFE|BRIDE)[\'S]*\s*(?:NAME)?[:\s]+(?:MS\.?\s*)?([A-Z\s]+?)(?=\s+(?:RESIDING|AGE|DATE|ADDRESS))",
+     "WIFE'S NAME: MS. SITA DEVI AGE: 27 YEARS"),
+    ('Marriage Certificate', 'wife[1]',
+     r'NAME\s*OF\s*WIFE\s*(?:MS\.?\s*)?([A-Z\s]+?)(?=\s+(?:RESIDING|AGE|DATE|ADDRESS))',
+     "NAME OF WIFE MS SITA DEVI RESIDING AT PUNE"),
+    ('Marriage Certificate', 'address[0]',
+     r'RESIDING\s*AT[:\s]+([A-Z0-9\s,/-]+?)(?=\s+(?:DATE|NAME|SOLEMNIZED|REGISTERED))',
+     "RESIDING AT: 45, MG ROAD, PUNE-411001 DATE OF MARRIAGE: 15/05/2015"),
+    ('Marriage Certificate', 'address[1]',
+     r'ADDRESS[:\s]+([A-Z0-9\s,/-]+?)(?=\s+(?:DATE|NAME|SOLEMNIZED|REGISTERED))',
+     "ADDRESS: 12 MG ROAD, PUNE NAME OF WIFE MS SITA DEVI"),
+    ('Marriage Certificate', 'place',
+     r'PLACE\s*OF\s*MARRIAGE[:\s]+([A-Z0-9\s,/-]+?)(?=\s+(?:DATE|IS|REGISTERED|ON))',
+     "PLACE OF MARRIAGE: ARYA SAMAJ MANDIR, PUNE DATE: 15/05/2015"),
+    ('Bank Passbook', 'bank_names[0]',
+     r'([A-Z]+\s+BANK(?:\s+OF\s+[A-Z]+)?)',
+     "PASSBOOK CENTRAL BANK OF INDIA BRANCH: SHIVAJI NAGAR"),
+    ('Bank Passbook', 'bank_names[3]',
+     r'([A-Z]+\s+BANKING\s+CORPORATION)',
+     "THE HONGKONG AND SHANGHAI BANKING CORPORATION LIMITED"),
+    ('Bank Passbook', 'branch_details[0]',
+     r'BRANCH[\s:]+([A-Z\s,/-]+?)(?=\s+(?:ADDRESS|CODE|IFSC|PIN|PHONE))',
+     "BRANCH: SHIVAJI NAGAR, PUNE IFSC: SBIN0001234"),
+    ('Bank Passbook', 'branch_details[1]',
+     r'BRANCH\s+ADDRESS[\s:]+([A-Z0-9\s,/-]+?)(?=\s+(?:PIN|PHONE|IFSC))',
+     "BRANCH ADDRESS: 12 FC ROAD, PUNE PIN 411005"),
+    ('Bank Passbook', 'name[0]',
+     r'(?:IN\s+THE\s+NAME\s+OF|NAME)[:\s]+([A-Z\s]+?)(?=\s+(?:BRANCH|ADDRESS|OCCUPATION|S/O|W/O))',
+     "NAME: RAHUL KUMAR S/O SURESH KUMAR"),
+    ('Bank Passbook', 'name[1]',
+     r'(?:ACCOUNT\s+HOLDER)[:\s]+([A-Z\s]+?)(?=\s+(?:BRANCH|ADDRESS|OCCUPATION|S/O|W/O))',
+     "ACCOUNT HOLDER: RAHUL KUMAR ADDRESS: 12 MG ROAD"),
+    ('Bank Passbook', 'address',
+     r'ADDRESS[:\s]+([A-Z0-9\s,/-]+?)(?=\s+(?:PIN|PHONE|BRANCH|IFSC))',
+     "ADDRESS: 12 MG ROAD, PUNE PHONE: 9876543210"),
+    ('Bank Passbook', 'type',
+     r'(?:ACCOUNT\s+TYPE|A/C\s+TYPE)[:\s]+([A-Z\s]+?)(?=\s+(?:BRANCH|ADDRESS|NAME))',
+     "ACCOUNT TYPE: SAVINGS NAME: RAHUL KUMAR"),
+    ('Employment Certificate', 'employee_patterns[0]',
+     r'THIS\s+IS\s+TO\s+CERTIFY\s+THAT\s+([A-Z][A-Z\s.-]+)(?:\s+HAS\s+BEEN|\s+IS\s+)',
+     "THIS IS TO CERTIFY THAT MR. RAHUL KUMAR HAS BEEN WORKING WITH US"),
+    ('Employment Certificate', 'employee_patterns[1]',
+     r'CERTIFY\s+THAT\s+([A-Z][A-Z\s.-]+)(?:\s+HAS\s+BEEN|\s+IS\s+)',
+     "WE CERTIFY THAT MS. PRIYA SHARMA IS AN EMPLOYEE"),
+    ('Employment Certificate', 'employee_patterns[2]',
+     r'THAT\s+([A-Z][A-Z\s.-]+)\s+(?:IS|HAS\s+BEEN)\s+EMPLOYED',
+     "THIS IS TO STATE THAT RAHUL KUMAR IS EMPLOYED WITH ABC PVT LTD"),
+    ('Employment Certificate', 'designation_patterns[0]',
+     r'AS\s+([A-Z][A-Z\s]+?)(?:\s+(?:FROM|SINCE|IN|AT|WITH|DEPARTMENT|FOR))',
+     "HE HAS BEEN WORKING AS SENIOR ENGINEER SINCE 2015"),
+    ('Employment Certificate', 'designation_patterns[1]',
+     r'(?:DESIGNATION|POST|POSITION)[:\s]+([A-Z][A-Z\s]+?)(?:\s+(?:FROM|SINCE|IN|AT|WITH))',
+     "DESIGNATION: ASSISTANT MANAGER FROM 01/04/2016"),
+    ('Employment Certificate', 'designation_patterns[2]',
+     r'(?:EMPLOYED|WORKING)\s+AS\s+([A-Z][A-Z\s]+?)(?:\s+(?:FROM|SINCE|IN|AT|WITH))',
+     "HE IS EMPLOYED AS SOFTWARE DEVELOPER WITH OUR COMPANY"),
+    ('Educational Certificates', 'institution_patterns[0]',
+     r'(?:A\s+UNIT\s+OF\s+)?([A-Z][A-Z\s.,&]+(?:PVT\.?\s*LTD\.?|PRIVATE\s+LIMITED|UNIVERSITY|COLLEGE|INSTITUTE|SCHOOL))',
+     "123 SAVITRIBAI PHULE PUNE UNIVERSITY CERTIFICATE"),
+    ('Educational Certificates', 'institution_patterns[2]',
+     r'([A-Z][A-Z\s.,&]+(?:UNIVERSITY|BOARD|INSTITUTE|COLLEGE))',
+     "2019: MAHARASHTRA STATE BOARD OF SECONDARY EDUCATION"),
+    ('Educational Certificates', 'student_patterns[0]',
+     r'THIS\s+IS\s+TO\s+CERTIFY\s+THAT\s+([A-Z][A-Z\s.-]+)(?:\s+S/O|\s+D/O|\s+HAS\s+|,)',
+     "THIS IS TO CERTIFY THAT RAHUL KUMAR S/O SURESH KUMAR"),
+    ('Educational Certificates', 'student_patterns[1]',
+     r'(?:MR\.|MS\.|SHRI|SMT\.)\s*([A-Z][A-Z\s.-]+)(?:\s+S/O|\s+D/O|\s+HAS\s+|,)',
+     "SHRI RAHUL KUMAR HAS PASSED THE EXAMINATION"),
+    ('Educational Certificates', 'student_patterns[2]',
+     r'CERTIFY\s+THAT\s+([A-Z][A-Z\s.-]+)(?:\s+S/O|\s+D/O|\s+HAS\s+|,)',
+     "WE CERTIFY THAT PRIYA SHARMA D/O RAMESH SHARMA"),
+    ('Educational Certificates', 'course_patterns[1]',
+     r'AWARDED\s+THE\s+([A-Z][A-Z\s.-]+?)(?:\s+COURSE|\s+CERTIFICATE|\s+DEGREE)',
+     "HAS BEEN AWARDED THE BACHELOR OF ENGINEERING DEGREE"),
+    ('Educational Certificates', 'course_patterns[2]',
+     r'COMPLETED\s+(?:THE\s+)?([A-Z][A-Z\s.-]+?)(?:\s+COURSE|\s+CERTIFICATE|\s+PROGRAM)',
+     "HAS SUCCESSFULLY COMPLETED THE ADVANCED DIPLOMA IN COMPUTING COURSE"),
+]
+
+REGISTERED = {(owner, name): pattern for owner, name, pattern in PATTERNS.items()}
+
+
+@pytest.mark.parametrize('owner, name, old_source, text', REWRITES,
+                         ids=[f'{owner}/{name}' for owner, name, _, _ in REWRITES])
+def test_rewrite_matches_like_before(owner, name, old_source, text):
+    pattern = REGISTERED[(owner, name)]
+    assert pattern.pattern != old_source, "not a rewritten pattern"
+    old = re.compile(old_source, pattern.flags)
+
+    before, after = old.search(text), pattern.search(text)
+    assert before is not None
+    assert after is not None
+    assert after.span() == before.span()
+    assert after.groups() == before.groups()
+
+
+def test_birth_certificate_reads_registration_number_without_group():
+    result = DOCUMENT_VALIDATORS['Birth Certificate'].validate(
+        "BIRTH CERTIFICATE MUNICIPAL CORPORATION REGISTRATION OF BIRTH BR/2019/123/456 "
+        "DATE OF BIRTH: 12/03/2019 NAME: RAVI KUMAR GENDER: MALE"
+    )
+    assert 'error' not in result
+    assert result['isValid']
+    assert result['confidenceScore'] == 0.73
+    assert result['extractedData']['registration_number'] == 'BR/2019/123/456'
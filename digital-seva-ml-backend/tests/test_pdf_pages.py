@@ -0,0 +1,54 @@
+# test_pdf_pages.py
+import pdf_pages
+from pdf_pages import count_pages, inspect_pages
+from uploads import UploadedPDF
+
+TEXT = "INCOME TAX DEPARTMENT PERMANENT ACCOUNT NUMBER CARD ABCPE1234F NAME RAHUL KUMAR"
+
+
+def make_pdf(texts):
+    """A minimal PDF with one page per text, each drawn in Helvetica"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for i, text in enumerate(texts):
+        page_id = 4 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources "
+                       f"<< /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode())
+        stream = f"BT /F1 10 Tf 40 740 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode())
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(texts)} >>".encode()
+
+    out, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def test_inspect_pages_stops_at_max_pages(monkeypatch):
+    inspected = []
+    median_text_height = pdf_pages._median_text_height
+    monkeypatch.setattr(pdf_pages, '_median_text_height',
+                        lambda page: inspected.append(page.page_number) or median_text_height(page))
+
+    with UploadedPDF.from_bytes(make_pdf([TEXT] * 6)) as upload:
+        pages, page_count = inspect_pages(upload, min_chars=10, max_pages=2)
+
+    assert page_count == 6
+    assert [page.number for page in pages] == [1, 2]
+    assert inspected == [1, 2]
+    assert all(page.text and 'ABCPE1234F' in page.text for page in pages)
+
+
+def test_inspect_pages_without_limit():
+    with UploadedPDF.from_bytes(make_pdf([TEXT] * 3)) as upload:
+        pages, page_count = inspect_pages(upload, min_chars=10)
+        assert count_pages(upload) == 3
+    assert page_count == 3
+    assert [page.number for page in pages] == [1, 2, 3]
@@ -0,0 +1,18 @@
+# test_regex_audit.py
+import identifier_extractor
+import normalized_text
+import regex_audit
+
+
+def test_text_module_patterns_are_audited():
+    audited = {(owner, name): pattern for owner, name, pattern in regex_audit.patterns()}
+    assert audited['identifier_extractor', 'STRETCH'] is identifier_extractor.STRETCH
+    assert audited['identifier_extractor', 'EMBEDDED[pan]'] is identifier_extractor.EMBEDDED['pan']
+    assert audited['normalized_text', 'ID_CONFUSIONS.pattern'] is normalized_text.ID_CONFUSIONS.pattern
+    assert ('normalized_text', 'ID_CONFUSIONS._layouts[10][0][0]') in audited
+    assert any(owner == 'PAN Card' for owner, _ in audited)
+
+
+def test_owner_limits_to_one_module():
+    owners = {owner for owner, _, _ in regex_audit.patterns('pdf_pages')}
+    assert owners == {'pdf_pages'}
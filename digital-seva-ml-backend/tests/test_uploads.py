@@ -0,0 +1,50 @@
+# test_uploads.py
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+
+# Keep the job database and OCR cache out of the working tree
+os.environ.setdefault('JOB_DB_PATH', os.path.join(tempfile.mkdtemp(), 'jobs.sqlite3'))
+os.environ.setdefault('OCR_CACHE_DIR', tempfile.mkdtemp())
+
+import app  # noqa: E402
+from uploads import UploadedPDF  # noqa: E402
+
+DATA = b'%PDF-1.4\n' + os.urandom(800 * 1024)
+
+
+@contextmanager
+def _parsed_upload(data, memory_limit, tmp_dir, monkeypatch):
+    monkeypatch.setitem(app.app.config, 'UPLOAD_MEMORY_LIMIT', memory_limit)
+    monkeypatch.setitem(app.app.config, 'UPLOAD_TMP_DIR', tmp_dir)
+    environ = {'method': 'POST', 'data': {'file': (io.BytesIO(data), 'a.pdf')}}
+    with app.app.test_request_context(**environ):
+        file = app.request.files['file']
+        with app.open_upload(file) as upload:
+            assert upload is file.stream
+            yield upload
+
+
+def test_parsed_upload_is_used_without_a_copy(tmp_path, monkeypatch):
+    with _parsed_upload(DATA, 1024 * 1024, str(tmp_path), monkeypatch) as upload:
+        assert upload.size == len(DATA)
+        assert upload.sha256 == hashlib.sha256(DATA).hexdigest()
+        assert upload.open().read() == DATA
+        assert os.listdir(tmp_path) == []
+
+
+def test_large_upload_spills_to_tmp_dir(tmp_path, monkeypatch):
+    with _parsed_upload(DATA, 64 * 1024, str(tmp_path), monkeypatch) as upload:
+        assert os.path.dirname(upload.path) == str(tmp_path)
+        with upload.open() as f:
+            assert f.read() == DATA
+        assert upload.sha256 == hashlib.sha256(DATA).hexdigest()
+    assert os.listdir(tmp_path) == []
+
+
+def test_copies_other_streams():
+    with UploadedPDF(io.BytesIO(DATA), max_memory_bytes=1024) as upload:
+        assert upload.read() == DATA
+        assert upload.sha256 == hashlib.sha256(DATA).hexdigest()
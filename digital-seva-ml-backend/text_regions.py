@@ -0,0 +1,95 @@
+# text_regions.py
+import logging
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]  # x, y, width, height
+
+
+def _find_text_lines(gray: np.ndarray, min_size: int, max_line_fraction: float) -> List[Box]:
+    """Find line-shaped blobs of character edges"""
+    height, width = gray.shape[:2]
+
+    # Character strokes have strong local contrast; flat background and smooth photo areas do not
+    ellipse = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, ellipse)
+    _, edges = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+
+    # Join neighbouring characters into one blob per line
+    line_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(width // 50, 9), 1))
+    joined = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, line_kernel)
+
+    contours, _ = cv2.findContours(joined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    lines = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w < min_size or h < min_size or h > height * max_line_fraction:
+            continue
+        # Text lines are partly filled with edges; solid artwork and empty frames are not
+        fill = cv2.countNonZero(edges[y:y + h, x:x + w]) / float(w * h)
+        if 0.1 <= fill <= 0.9:
+            lines.append((x, y, w, h))
+    return lines
+
+
+def _group_into_blocks(lines: List[Box], gap_factor: float = 1.2) -> List[Box]:
+    """Merge vertically adjacent, horizontally overlapping lines into text blocks"""
+    blocks: List[List[int]] = []
+    for x, y, w, h in sorted(lines, key=lambda box: box[1]):
+        for block in blocks:
+            bx, by, bw, bh = block
+            close_below = y - (by + bh) <= gap_factor * h
+            overlaps = x < bx + bw and bx < x + w
+            if close_below and overlaps:
+                right, bottom = max(bx + bw, x + w), max(by + bh, y + h)
+                block[0], block[1] = min(bx, x), min(by, y)
+                block[2], block[3] = right - block[0], bottom - block[1]
+                break
+        else:
+            blocks.append([x, y, w, h])
+    return [tuple(block) for block in blocks]
+
+
+def _reading_order(blocks: List[Box]) -> List[Box]:
+    """Sort blocks top to bottom, and left to right within a row of side-by-side blocks"""
+    rows: List[List[Box]] = []
+    for block in sorted(blocks, key=lambda box: box[1]):
+        if rows:
+            row_bottom = max(y + h for _, y, _, h in rows[-1])
+            if block[1] < row_bottom - block[3] // 2:
+                rows[-1].append(block)
+                continue
+        rows.append([block])
+    return [block for row in rows for block in sorted(row, key=lambda box: box[0])]
+
+
+def detect_text_regions(gray: np.ndarray, padding: int = 8, min_size: int = 8,
+                        max_line_fraction: float = 0.08,
+                        max_coverage: float = 0.85) -> Optional[List[Box]]:
+    """Return padded text block boxes in reading order.
+
+    Returns None when no text is found or the blocks cover most of the page,
+    in which case OCRing the full page is just as cheap.
+    """
+    height, width = gray.shape[:2]
+    lines = _find_text_lines(gray, min_size, max_line_fraction)
+    if not lines:
+        return None
+
+    regions = []
+    for x, y, w, h in _reading_order(_group_into_blocks(lines)):
+        x0, y0 = max(x - padding, 0), max(y - padding, 0)
+        x1, y1 = min(x + w + padding, width), min(y + h + padding, height)
+        regions.append((x0, y0, x1 - x0, y1 - y0))
+
+    coverage = sum(w * h for _, _, w, h in regions) / float(width * height)
+    if coverage > max_coverage:
+        logger.debug(f"Text regions cover {coverage:.0%} of the page; using the full page")
+        return None
+    logger.debug(f"Found {len(regions)} text regions covering {coverage:.0%} of the page")
+    return regions
@@ -0,0 +1,104 @@
+# uploads.py
+import hashlib
+import io
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def default_tmp_dir() -> Optional[str]:
+    """Prefer a tmpfs mount for upload spill files so they never hit disk"""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+class UploadedPDF:
+    """One request's PDF upload, hashed as it is written.
+
+    Uploads up to max_memory_bytes stay in memory; larger ones spill into a
+    private temporary file. The app's form parser writes file fields straight
+    into one of these, so the handler gets the upload without another copy;
+    UploadedPDF(stream) and from_bytes() fill one from elsewhere. Poppler
+    needs a path to render pages, so an in-memory upload is written to its
+    own temporary file only when a page is actually rendered. Use as a
+    context manager: close() always removes the temporary file, and no file
+    name is shared between requests.
+    """
+
+    def __init__(self, stream: Optional[BinaryIO] = None, max_memory_bytes: int = 16 * 1024 * 1024,
+                 tmp_dir: Optional[str] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self.tmp_dir = tmp_dir
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file = None
+
+        if stream is not None:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                self.write(chunk)
+            self.seek(0)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, **kwargs) -> 'UploadedPDF':
+        return cls(io.BytesIO(data), **kwargs)
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def _spill(self) -> None:
+        self._file = tempfile.NamedTemporaryFile(prefix='upload_', suffix='.pdf', dir=self.tmp_dir)
+        self._file.write(self._buffer.getvalue())
+        self._file.seek(self._buffer.tell())
+        self._buffer = None
+
+    # File interface for the form parser, and for handlers reading the field directly
+    def write(self, chunk: bytes) -> int:
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        if self._file is None and self.size > self.max_memory_bytes:
+            self._spill()
+        return (self._file or self._buffer).write(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return (self._file or self._buffer).seek(offset, whence)
+
+    def tell(self) -> int:
+        return (self._file or self._buffer).tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return (self._file or self._buffer).read(size)
+
+    def open(self) -> BinaryIO:
+        """Return a readable, seekable handle on the upload positioned at the start"""
+        if self._file is not None:
+            self._file.flush()
+            return open(self._file.name, 'rb')
+        # A BytesIO over the bytes the buffer already holds; CPython shares them rather than copying
+        return io.BytesIO(self._buffer.getvalue())
+
+    @property
+    def path(self) -> str:
+        """Path of a private file holding the upload, created on first use"""
+        if self._file is None:
+            self._spill()
+        self._file.flush()
+        return self._file.name
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()  # NamedTemporaryFile deletes itself on close
+            self._file = None
+        self._buffer = None
+
+    def __enter__(self) -> 'UploadedPDF':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
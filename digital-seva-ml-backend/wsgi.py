@@ -0,0 +1,5 @@
+# wsgi.py
+"""Production entry point: gunicorn -c gunicorn.conf.py wsgi:app"""
+from app import app, warm_up
+
+__all__ = ['app', 'warm_up']